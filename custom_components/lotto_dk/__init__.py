@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from time import perf_counter
 
-from custom_components.lotto_dk.component_api import ComponentApi
+from custom_components.lotto_dk.component_api import ComponentApi, LottoData
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import CONF_EURO_JACKPOT, CONF_LOTTO, CONF_VIKING_LOTTO, DOMAIN, LOGGER
+from .const import (
+    CONF_LISTEN_TO_TIMER_TRIGGER,
+    DOMAIN,
+    DOMAIN_NAME,
+    LOGGER,
+    SIGNAL_OPTIONS_UPDATED,
+    TRANSLATION_KEY_MISSING_TIMER_ENTITY,
+)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
@@ -22,7 +32,7 @@ PLATFORMS: list[Platform] = [Platform.SENSOR]
 class CommonData:
     """Common data."""
 
-    coordinator: DataUpdateCoordinator
+    coordinator: DataUpdateCoordinator[LottoData]
     component_api: ComponentApi
 
 
@@ -34,28 +44,40 @@ type CommonConfigEntry = ConfigEntry[CommonData]
 async def async_setup_entry(hass: HomeAssistant, entry: CommonConfigEntry) -> bool:
     """Set up Lotto DK from a config entry."""
 
-    coordinator: DataUpdateCoordinator = DataUpdateCoordinator(
+    start: float = perf_counter()
+    coordinator: DataUpdateCoordinator[LottoData] = DataUpdateCoordinator(
         hass,
         LOGGER,
         name=DOMAIN,
     )
 
     component_api: ComponentApi = ComponentApi(
-        hass,
-        coordinator,
-        async_get_clientsession(hass),
-        entry.options[CONF_EURO_JACKPOT],
-        entry.options[CONF_LOTTO],
-        entry.options[CONF_VIKING_LOTTO],
+        hass, coordinator, async_get_clientsession(hass)
     )
 
+    component_api.update_options(entry.options)
     entry.runtime_data = CommonData(coordinator, component_api)
 
+    _async_cleanup_issues(hass, entry)
+
+    loaded: bool = await component_api.async_load()
+
+    if loaded:
+        coordinator.async_set_updated_data(component_api.snapshot())
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    await coordinator.async_config_entry_first_refresh()
+
+    if loaded:
+        # Serve the stored price pools now and refresh them in the background
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
+    component_api.metrics.setup_duration = perf_counter() - start
     return True
 
 
@@ -77,6 +99,57 @@ async def update_listener(
     hass: HomeAssistant,
     config_entry: CommonConfigEntry,
 ) -> None:
-    """Reload on config entry update."""
+    """Apply options in place on config entry update.
+
+    Cached price pools are kept, only newly selected games are scraped.
+    """
+
+    games_changed, results_changed, timer_changed = (
+        config_entry.runtime_data.component_api.update_options(config_entry.options)
+    )
+
+    if timer_changed:
+        _async_cleanup_issues(hass, config_entry)
+
+    if games_changed or results_changed or timer_changed:
+        async_dispatcher_send(hass, SIGNAL_OPTIONS_UPDATED, timer_changed)
+
+    if games_changed or results_changed:
+        await config_entry.runtime_data.coordinator.async_request_refresh()
+
+
+# ------------------------------------------------------------------
+def _missing_timer_issue_prefix(entry: CommonConfigEntry) -> str:
+    """Return the prefix of the missing timer issue ids of entry."""
+
+    return f"{TRANSLATION_KEY_MISSING_TIMER_ENTITY}_{entry.entry_id}_"
+
+
+# ------------------------------------------------------------------
+def missing_timer_issue_id(entry: CommonConfigEntry) -> str:
+    """Return the stable repair issue id for a missing timer entity of entry."""
+
+    return _missing_timer_issue_prefix(entry) + entry.options.get(
+        CONF_LISTEN_TO_TIMER_TRIGGER, ""
+    )
+
+
+# ------------------------------------------------------------------
+@callback
+def _async_cleanup_issues(hass: HomeAssistant, entry: CommonConfigEntry) -> None:
+    """Delete the repair issues of entry which no longer apply.
+
+    Only the issue for the currently configured timer entity is kept, the
+    issues of other entries are left alone. This also removes the issues
+    created with a timestamp id by older versions.
+    """
+
+    prefix: str = _missing_timer_issue_prefix(entry)
+    issue_id: str = missing_timer_issue_id(entry)
+
+    for domain, other_issue_id in list(ir.async_get(hass).issues):
+        if domain != DOMAIN or other_issue_id == issue_id:
+            continue
 
-    await hass.config_entries.async_reload(config_entry.entry_id)
+        if other_issue_id.startswith((prefix, DOMAIN_NAME)):
+            ir.async_delete_issue(hass, DOMAIN, other_issue_id)
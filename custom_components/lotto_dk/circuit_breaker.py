@@ -0,0 +1,90 @@
+"""Circuit breaker."""
+
+from datetime import datetime, timedelta
+from enum import StrEnum
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class CircuitState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class CircuitBreaker:
+    """Stop requests after repeated failures and probe again later.
+
+    After failure_threshold consecutive failures the circuit opens. Once
+    reset_timeout has passed a single half-open probe is allowed; a failed
+    probe opens the circuit again with a doubled timeout, up to
+    max_reset_timeout.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: timedelta = timedelta(minutes=15),
+        max_reset_timeout: timedelta = timedelta(hours=4),
+    ) -> None:
+        """Init."""
+
+        self.failure_threshold: int = failure_threshold
+        self.base_reset_timeout: timedelta = reset_timeout
+        self.max_reset_timeout: timedelta = max_reset_timeout
+        self.reset_timeout: timedelta = reset_timeout
+        self.state: CircuitState = CircuitState.CLOSED
+        self.failures: int = 0
+        self.opened_at: datetime | None = None
+
+    # ------------------------------------------------------------------
+    def allow_request(self, now: datetime) -> bool:
+        """Return if a request may be sent now."""
+
+        match self.state:
+            case CircuitState.CLOSED:
+                return True
+            case CircuitState.OPEN:
+                if now >= self.opened_at + self.reset_timeout:
+                    self.state = CircuitState.HALF_OPEN
+                    return True
+                return False
+            case _:
+                # Only one probe at a time
+                return False
+
+    # ------------------------------------------------------------------
+    def next_probe(self) -> datetime | None:
+        """Return when the open circuit lets the next probe through."""
+
+        if self.state != CircuitState.OPEN:
+            return None
+
+        return self.opened_at + self.reset_timeout
+
+    # ------------------------------------------------------------------
+    def record_success(self) -> None:
+        """Register a successful request."""
+
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.reset_timeout = self.base_reset_timeout
+
+    # ------------------------------------------------------------------
+    def record_failure(self, now: datetime) -> None:
+        """Register a failed request."""
+
+        self.failures += 1
+
+        if self.state == CircuitState.HALF_OPEN:
+            self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+        elif self.failures < self.failure_threshold:
+            return
+
+        self.state = CircuitState.OPEN
+        self.opened_at = now
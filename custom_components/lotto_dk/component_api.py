@@ -1,25 +1,76 @@
 """Lotto interface."""
 
+import asyncio
 from asyncio import timeout
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from enum import Enum
+from http import HTTPStatus
+import random
+from time import perf_counter
+from types import MappingProxyType
+from typing import Any
 
 from aiohttp.client import ClientSession
-from bs4 import BeautifulSoup
-
-from homeassistant.core import HomeAssistant, ServiceCall
+from aiohttp.client_exceptions import ClientError
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .circuit_breaker import CircuitBreaker
+from .const import (
+    CONF_LISTEN_TO_TIMER_TRIGGER,
+    CONF_RESTART_TIMER,
+    CONF_RESULT_PATH,
+    CONF_RESULT_URL,
+    CONF_SOURCE,
+    CONF_SOURCE_PATH,
+    CONF_SOURCE_URL,
+    DOMAIN,
+    SOURCE_EMBEDDED_JSON,
+    SOURCE_JSON,
+    SOURCE_TITLE,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from .draw_schedule import ScrapeScheduler
+from .games import GAME_IDS, GAMES, LottoTypes, scroll_successors, selected_games
+from .metrics import GameMetrics, ScrapeMetrics
+from .pool_history import PoolHistory
+from .request_cache import RequestCache
+from .results import DrawResult, ResultSource
+from .row_generator import ROWS_MAX, async_generate_rows
+from .sources import EmbeddedJsonSource, JsonSource, PricePoolSource, TitleSource
+from .statistics_import import async_import_statistics
+from .tickets import async_check_tickets, drawn_result
+
+_PARSE_ERRORS = (IndexError, KeyError, TypeError, ValueError, AttributeError)
+
 
-from .const import DOMAIN
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class PricePool:
+    """Price pool snapshot for a game."""
 
+    price_pool: int
+    fetched: datetime | None = None
+    change_since_last_draw: int | None = None
+    growth_per_draw: float | None = None
+    rollovers: int = 0
 
-class LottoTypes(Enum):
-    """Lotto enum."""
 
-    LOTTO = 1
-    EURO_JACKPOT = 2
-    VIKING_LOTTO = 3
+type LottoData = Mapping[LottoTypes, PricePool]
 
 
 # ------------------------------------------------------------------
@@ -28,126 +79,670 @@ class LottoTypes(Enum):
 class ComponentApi:
     """Lotto interface."""
 
-    _EURO_JACKPOT_URL = "https://danskespil.dk/eurojackpot"
-    _LOTTO_URL = "https://danskespil.dk/lotto"
-    _VIKING_LOTTO_URL = "https://danskespil.dk/vikinglotto"
-
     def __init__(
         self,
         hass: HomeAssistant,
         coordinator: DataUpdateCoordinator,
-        session: ClientSession | None,
-        euro_jackpot: bool,
-        lotto: bool,
-        viking_lotto: bool,
+        session: ClientSession,
     ) -> None:
         """Lotto interface."""
         self.hass = hass
         self.coordinator: DataUpdateCoordinator = coordinator
         self.session: ClientSession = session
-        self.get_euro_jackpot: bool = euro_jackpot
-        self.euro_jackpot_price_pool: int = 0
-        self.get_lotto: bool = lotto
-        self.lotto_price_pool: int = 0
-        self.get_viking_lotto: bool = viking_lotto
-        self.viking_lotto_price_pool: int = 0
+        self.selected: frozenset[LottoTypes] = frozenset()
+        self.scroll_successors: dict[LottoTypes, LottoTypes] = {}
+        self.timer_options: tuple[str, bool] | None = None
+        self.source_options: tuple[str, str, str] | None = None
+        self.result_options: tuple[str, str] | None = None
+        self.price_pools: dict[LottoTypes, PricePool] = {}
+        self.pool_histories: dict[LottoTypes, PoolHistory] = {
+            lotto_type: PoolHistory() for lotto_type in GAMES
+        }
+        self.urls: dict[LottoTypes, str] = {
+            lotto_type: game.url for lotto_type, game in GAMES.items()
+        }
         self.request_timeout: float = 3
-        self.close_session: bool = False
+        self.request_retries: int = 2
+        self.request_retry_backoff: float = 0.5
+        self.circuit_breakers: dict[LottoTypes, CircuitBreaker] = {
+            lotto_type: CircuitBreaker() for lotto_type in GAMES
+        }
+        self.request_cache: RequestCache = RequestCache()
+        # Sources in order of preference, set from the options
+        self.sources: list[PricePoolSource] = [TitleSource(hass, self.urls)]
+        # Result sources, set from the options. None without a result url
+        self.result_sources: list[ResultSource] = []
+        self.results: dict[LottoTypes, DrawResult] = {}
+        self.metrics: ScrapeMetrics = ScrapeMetrics()
         self.lotto_price_pool_scroll: str = ""
-        self.lotto_price_pool_scroll_next: LottoTypes = LottoTypes.EURO_JACKPOT
-        self.next_webscrape: datetime = datetime.now()
-        self.next_webscrape_delta: int = 60
+        self.lotto_price_pool_scroll_texts: dict[LottoTypes, str] = {}
+        self.lotto_price_pool_scroll_next: LottoTypes = next(iter(GAMES))
+        self.scrape_scheduler: ScrapeScheduler = ScrapeScheduler(
+            {lotto_type: game.schedule for lotto_type, game in GAMES.items()}
+        )
+        self.store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
 
         self.coordinator.update_interval = timedelta(minutes=10)
         self.coordinator.update_method = self.async_update
         """Setup the actions for the Lotto integration."""
         hass.services.async_register(DOMAIN, "update", self.async_update_service)
+        hass.services.async_register(
+            DOMAIN,
+            "import_statistics",
+            self.async_import_statistics_service,
+            schema=vol.Schema({vol.Required("file"): cv.string}),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            "check_tickets",
+            self.async_check_tickets_service,
+            schema=vol.All(
+                vol.Schema(
+                    {
+                        vol.Required("game"): vol.In(GAME_IDS),
+                        vol.Exclusive("rows", "rows"): vol.All(
+                            cv.ensure_list, [cv.string]
+                        ),
+                        vol.Exclusive("file", "rows"): cv.string,
+                        vol.Optional("numbers"): vol.All(
+                            cv.ensure_list, [vol.Coerce(int)]
+                        ),
+                        vol.Optional("extra_numbers"): vol.All(
+                            cv.ensure_list, [vol.Coerce(int)]
+                        ),
+                    }
+                ),
+                cv.has_at_least_one_key("rows", "file"),
+            ),
+            supports_response=SupportsResponse.ONLY,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            "generate_rows",
+            self.async_generate_rows_service,
+            schema=vol.Schema(
+                {
+                    vol.Required("game"): vol.In(GAME_IDS),
+                    vol.Optional("count"): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=ROWS_MAX)
+                    ),
+                    vol.Optional("system"): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+                    vol.Optional("system_extra"): vol.All(
+                        cv.ensure_list, [vol.Coerce(int)]
+                    ),
+                    vol.Optional("file"): cv.string,
+                }
+            ),
+            supports_response=SupportsResponse.ONLY,
+        )
 
-        self.find_next_lotto_scroll()
+    # ------------------------------------------------------------------
+    async def async_load(self) -> bool:
+        """Load last known price pools from storage.
+
+        Returns:
+            bool: True if any price pool was loaded
+
+        """
+
+        data: dict | None = await self.store.async_load()
+
+        if not data:
+            return False
+
+        loaded: bool = False
+
+        results: dict = data.get("results", {})
+
+        for lotto_type, game in GAMES.items():
+            if (result := results.get(game.unique_id)) is not None:
+                self.results[lotto_type] = DrawResult.from_dict(result)
+
+            if (item := data.get(game.unique_id)) is None:
+                continue
+
+            if (history := item.get("history")) is not None:
+                self.pool_histories[lotto_type] = PoolHistory.from_dict(history)
+
+            self._set_price_pool(
+                lotto_type,
+                item["price_pool"],
+                dt_util.parse_datetime(item["fetched"]) if item["fetched"] else None,
+            )
+            loaded = True
+
+        if loaded:
+            self.update_scroll_texts()
+            self.roll_price_pools()
+
+        return loaded
+
+    # ------------------------------------------------------------------
+    def _data_to_save(self) -> dict:
+        """Return data to save to storage."""
+
+        data: dict = {
+            GAMES[lotto_type].unique_id: {
+                "price_pool": price_pool.price_pool,
+                "fetched": price_pool.fetched.isoformat()
+                if price_pool.fetched is not None
+                else None,
+                "history": self.pool_histories[lotto_type].as_dict(),
+            }
+            for lotto_type, price_pool in self.price_pools.items()
+        }
+        data["results"] = {
+            GAMES[lotto_type].unique_id: result.as_dict()
+            for lotto_type, result in self.results.items()
+        }
+        return data
+
+    # ------------------------------------------------------------------
+    def snapshot(self) -> LottoData:
+        """Return an immutable snapshot of the price pools."""
+
+        return MappingProxyType(dict(self.price_pools))
 
     # ------------------------------------------------------------------
     async def async_update_service(self, call: ServiceCall) -> None:
         """Lotto update service interface."""
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_refresh()
+
+    # ------------------------------------------------------------------
+    async def async_import_statistics_service(
+        self, call: ServiceCall
+    ) -> ServiceResponse:
+        """Import price pool archive into long-term statistics."""
+
+        imported: dict[str, int] = await async_import_statistics(
+            self.hass,
+            call.data["file"],
+            {game.unique_id: game.name for game in GAMES.values()},
+        )
+        return {"imported": imported}
+
+    # ------------------------------------------------------------------
+    async def async_check_tickets_service(self, call: ServiceCall) -> ServiceResponse:
+        """Check ticket rows against the drawn numbers or the latest draw result."""
+
+        lotto_type: LottoTypes = GAME_IDS[call.data["game"]]
+        result: DrawResult | None
+
+        if (numbers := call.data.get("numbers")) is not None:
+            try:
+                result = drawn_result(
+                    GAMES[lotto_type].rules,
+                    dt_util.now().date(),
+                    numbers,
+                    call.data.get("extra_numbers", []),
+                )
+            except ValueError as err:
+                raise HomeAssistantError(f"Invalid drawn numbers: {err}") from err
+        elif (result := self.results.get(lotto_type)) is None:
+            raise HomeAssistantError(
+                f"No draw result for {GAMES[lotto_type].name}, give the drawn numbers"
+            )
+
+        return await async_check_tickets(
+            self.hass,
+            GAMES[lotto_type].rules,
+            result,
+            call.data.get("rows"),
+            call.data.get("file"),
+        )
+
+    # ------------------------------------------------------------------
+    async def async_generate_rows_service(self, call: ServiceCall) -> ServiceResponse:
+        """Generate unique random rows or the rows of a system for a game."""
+
+        return await async_generate_rows(
+            self.hass,
+            GAMES[GAME_IDS[call.data["game"]]].rules,
+            call.data.get("count"),
+            call.data.get("system"),
+            call.data.get("system_extra"),
+            call.data.get("file"),
+        )
 
     # ------------------------------------------------------------------
-    async def async_update(self) -> None:
+    async def async_update(self) -> LottoData:
         """Lotto update interface."""
 
-        if self.next_webscrape < datetime.now():
-            self.next_webscrape = datetime.now() + timedelta(
-                minutes=self.next_webscrape_delta
+        start: float = perf_counter()
+        now: datetime = dt_util.utcnow()
+        selected: list[LottoTypes] = [
+            lotto_type for lotto_type in GAMES if lotto_type in self.selected
+        ]
+
+        due: list[LottoTypes] = []
+
+        for lotto_type in self.scrape_scheduler.due(selected, now):
+            if self.circuit_breakers[lotto_type].allow_request(now):
+                due.append(lotto_type)
+            else:
+                self._postpone_to_probe(lotto_type)
+
+        results_due: list[LottoTypes] = [
+            lotto_type
+            for lotto_type in selected
+            if self._result_source(lotto_type) is not None
+            and self._result_outdated(lotto_type, now)
+        ]
+
+        if due or results_due:
+            pools: dict[LottoTypes, int]
+            pools, _ = await asyncio.gather(
+                self._async_get_price_pools(due),
+                self._async_update_results(results_due),
             )
 
-            if self.session is None:
-                self.session = ClientSession()
-                self.close_session = True
+            for lotto_type in due:
+                # A failed game keeps its last good price pool
+                if (pool := pools.get(lotto_type)) is None:
+                    self.circuit_breakers[lotto_type].record_failure(now)
+                    self.scrape_scheduler.register(
+                        lotto_type, now, changed=False, failed=True
+                    )
+                    self._postpone_to_probe(lotto_type)
+                    continue
+
+                self.circuit_breakers[lotto_type].record_success()
+                old_price_pool: PricePool | None = self.price_pools.get(lotto_type)
+                self._set_price_pool(lotto_type, pool, now)
+                self.scrape_scheduler.register(
+                    lotto_type,
+                    now,
+                    changed=old_price_pool is not None
+                    and old_price_pool.price_pool != pool,
+                )
+
+            self.update_scroll_texts()
+            self.store.async_delay_save(self._data_to_save, 10)
+
+        if (next_scrape := self.scrape_scheduler.next_scrape(selected)) is not None:
+            self.coordinator.update_interval = max(
+                next_scrape - dt_util.utcnow(), timedelta(minutes=1)
+            )
+
+        self.metrics.record_refresh(perf_counter() - start)
+        return self.snapshot()
+
+    # ------------------------------------------------------
+    def _postpone_to_probe(self, lotto_type: LottoTypes) -> None:
+        """Schedule a game with an open circuit for its next probe.
+
+        Otherwise its past next scrape would keep the refresh interval at
+        the minimum for as long as the circuit is open.
+        """
+
+        if (next_probe := self.circuit_breakers[lotto_type].next_probe()) is not None:
+            self.scrape_scheduler.postpone(lotto_type, next_probe)
+
+    # ------------------------------------------------------
+    @property
+    def update_timeout(self) -> float:
+        """Return the deadline of a refresh cycle.
+
+        Sized to fit every attempt of every source plus the largest backoff
+        of each retry, so the last retry is not cancelled.
+        """
 
-            if self.get_lotto:
-                pool: int = await self._async_get_price_pool(self._LOTTO_URL)
+        return (
+            self.request_timeout * len(self.sources) * (self.request_retries + 1)
+            + self.request_retry_backoff * (2**self.request_retries - 1)
+            + 1
+        )
 
-                if pool != 0:
-                    self.lotto_price_pool = pool
+    # ------------------------------------------------------
+    def _set_price_pool(
+        self, lotto_type: LottoTypes, pool: int, fetched: datetime | None
+    ) -> None:
+        """Set price pool and add it to the history."""
 
-            if self.get_viking_lotto:
-                pool: int = await self._async_get_price_pool(self._VIKING_LOTTO_URL)
+        history: PoolHistory = self.pool_histories[lotto_type]
+        history.add(pool, fetched if fetched is not None else dt_util.utcnow())
 
-                if pool != 0:
-                    self.viking_lotto_price_pool = pool
+        self.price_pools[lotto_type] = PricePool(
+            pool,
+            fetched,
+            history.change_since_last_draw,
+            history.growth_per_draw,
+            history.rollovers,
+        )
 
-            if self.get_euro_jackpot:
-                pool: int = await self._async_get_price_pool(self._EURO_JACKPOT_URL)
+    # ------------------------------------------------------
+    def get_price_pool(self, lotto_type: LottoTypes) -> int:
+        """Get price pool for lotto type."""
 
-                if pool != 0:
-                    self.euro_jackpot_price_pool = pool
+        if (price_pool := self.price_pools.get(lotto_type)) is None:
+            return 0
 
-            if self.session and self.close_session:
-                await self.session.close()
+        return price_pool.price_pool
 
-        self.roll_price_pools()
+    # ------------------------------------------------------
+    def update_options(self, options: Mapping[str, Any]) -> tuple[bool, bool, bool]:
+        """Apply changed options.
+
+        A changed price pool source is used from the next scrape.
+
+        Returns:
+            tuple[bool, bool, bool]: If the game selection, the result source
+            and the timer options changed
+
+        """
+
+        selection: frozenset[LottoTypes] = selected_games(options)
+        source_options: tuple[str, str, str] = (
+            options.get(CONF_SOURCE, SOURCE_TITLE),
+            options.get(CONF_SOURCE_URL, ""),
+            options.get(CONF_SOURCE_PATH, ""),
+        )
+        result_options: tuple[str, str] = (
+            options.get(CONF_RESULT_URL, ""),
+            options.get(CONF_RESULT_PATH, ""),
+        )
+        timer_options: tuple[str, bool] = (
+            options.get(CONF_LISTEN_TO_TIMER_TRIGGER, ""),
+            options.get(CONF_RESTART_TIMER, False),
+        )
+
+        games_changed: bool = selection != self.selected
+        results_changed: bool = result_options != self.result_options
+        timer_changed: bool = timer_options != self.timer_options
+        self.timer_options = timer_options
+
+        if games_changed:
+            self.selected = selection
+            self.scroll_successors = scroll_successors(selection)
+            self.update_scroll_texts()
+
+            if not self.is_selected(self.lotto_price_pool_scroll_next):
+                self.find_next_lotto_scroll()
+
+        if source_options != self.source_options:
+            self.source_options = source_options
+            self.sources = self._create_sources(*source_options)
+            self.request_cache = RequestCache()
+
+        if results_changed:
+            self.result_options = result_options
+            self.result_sources = self._create_result_sources(*result_options)
+
+        return games_changed, results_changed, timer_changed
 
     # ------------------------------------------------------
-    async def _async_get_price_pool(self, url: str) -> int:
+    def _create_sources(
+        self, source: str, url_template: str, path: str
+    ) -> list[PricePoolSource]:
+        """Create the price pool sources in order of preference.
+
+        The title of the game page is always the last source, the fallback
+        when the structured source fails. The JSON endpoint url_template has
+        {game} for the game id.
+        """
+
+        title_source: TitleSource = TitleSource(self.hass, self.urls)
+
+        if source == SOURCE_EMBEDDED_JSON:
+            return [EmbeddedJsonSource(self.hass, self.urls, path), title_source]
+
+        if source == SOURCE_JSON:
+            urls: dict[LottoTypes, str] = {
+                lotto_type: url_template.format(game=game.unique_id)
+                for lotto_type, game in GAMES.items()
+            }
+            return [JsonSource(self.hass, urls, path), title_source]
+
+        return [title_source]
+
+    # ------------------------------------------------------
+    def _create_result_sources(
+        self, url_template: str, path: str
+    ) -> list[ResultSource]:
+        """Create the result sources, none without a result url.
+
+        The result url_template has {game} for the game id.
+        """
+
+        if not url_template:
+            return []
+
+        urls: dict[LottoTypes, str] = {
+            lotto_type: url_template.format(game=game.unique_id)
+            for lotto_type, game in GAMES.items()
+        }
+        return [ResultSource(self.hass, urls, path)]
+
+    # ------------------------------------------------------
+    def is_selected(self, lotto_type: LottoTypes) -> bool:
+        """Return if lotto type is selected."""
+
+        return lotto_type in self.selected
+
+    # ------------------------------------------------------
+    def _result_source(self, lotto_type: LottoTypes) -> ResultSource | None:
+        """Return the first result source covering lotto type."""
+
+        for source in self.result_sources:
+            if source.url(lotto_type) is not None:
+                return source
+
+        return None
+
+    # ------------------------------------------------------
+    def has_result_source(self, lotto_type: LottoTypes) -> bool:
+        """Return if a result source covers lotto type."""
+
+        return self._result_source(lotto_type) is not None
+
+    # ------------------------------------------------------
+    def _result_outdated(self, lotto_type: LottoTypes, now: datetime) -> bool:
+        """Return if a draw has taken place since the stored result.
+
+        This is the cheap check, done from the draw calendar without any
+        request.
+        """
+
+        if (result := self.results.get(lotto_type)) is None:
+            return True
+
+        last_draw: datetime = GAMES[lotto_type].schedule.last_draw(
+            now, self.scrape_scheduler.tz
+        )
+        return result.draw_date < last_draw.date()
+
+    # ------------------------------------------------------
+    async def _async_update_results(self, lotto_types: list[LottoTypes]) -> None:
+        """Fetch and parse draw results for lotto types concurrently."""
+
+        results: list[DrawResult | None] = await asyncio.gather(
+            *(self._async_get_result(lotto_type) for lotto_type in lotto_types)
+        )
+
+        for lotto_type, result in zip(lotto_types, results, strict=True):
+            if result is None:
+                continue
+
+            if (
+                old_result := self.results.get(lotto_type)
+            ) is None or result.draw_date > old_result.draw_date:
+                self.results[lotto_type] = result
+
+    # ------------------------------------------------------
+    async def _async_get_result(self, lotto_type: LottoTypes) -> DrawResult | None:
+        """Get draw result for lotto type."""
+
+        source: ResultSource = self._result_source(lotto_type)
+        metrics: GameMetrics = self.metrics.game(
+            GAMES[lotto_type].unique_id + "_result"
+        )
+        metrics.requests += 1
+
         try:
             async with timeout(self.request_timeout):
-                response = await self.session.get(url)
-                soup = await self.hass.async_add_executor_job(
-                    BeautifulSoup, await response.text(), "lxml"
+                response = await self.session.get(source.url(lotto_type))
+                response.raise_for_status()
+                result: DrawResult = await source.async_read(response, metrics)
+        except (TimeoutError, ClientError, *_PARSE_ERRORS) as err:
+            metrics.record_error(err)
+            return None
+
+        metrics.record_success()
+        return result
+
+    # ------------------------------------------------------
+    async def _async_get_price_pools(
+        self, lotto_types: list[LottoTypes]
+    ) -> dict[LottoTypes, int]:
+        """Fetch price pools for the given games concurrently.
+
+        Each attempt is bounded by request_timeout and the whole cycle by
+        update_timeout. Games not done by the deadline are cancelled, the
+        results of the finished games are kept. Failed games are left out.
+        """
+
+        if not lotto_types:
+            return {}
+
+        tasks: dict[asyncio.Task, LottoTypes] = {
+            asyncio.create_task(self._async_get_price_pool(lotto_type)): lotto_type
+            for lotto_type in lotto_types
+        }
+
+        done, pending = await asyncio.wait(tasks, timeout=self.update_timeout)
+
+        for task in pending:
+            task.cancel()
+            self.metrics.game(GAMES[tasks[task]].unique_id).errors["UpdateTimeout"] += 1
+
+        pools: dict[LottoTypes, int] = {}
+
+        for task in done:
+            if task.cancelled():
+                continue
+
+            if (err := task.exception()) is not None:
+                self.metrics.game(GAMES[tasks[task]].unique_id).record_error(err)
+                continue
+
+            if (pool := task.result()) is not None:
+                pools[tasks[task]] = pool
+
+        return pools
+
+    # ------------------------------------------------------
+    async def _async_get_price_pool(self, lotto_type: LottoTypes) -> int | None:
+        """Get price pool, retrying transient errors with backoff and jitter.
+
+        Returns:
+            int | None: Price pool or None if it could not be fetched
+
+        """
+
+        metrics: GameMetrics = self.metrics.game(GAMES[lotto_type].unique_id)
+
+        for attempt in range(self.request_retries + 1):
+            if attempt > 0:
+                await asyncio.sleep(
+                    random.uniform(0, self.request_retry_backoff * 2 ** (attempt - 1))
                 )
-                return int(soup.title.text.split()[4].replace(".", ""))
-        except TimeoutError:
-            pass
-        except IndexError:
-            pass
 
-        return 0
+            metrics.requests += 1
+            start: float = perf_counter()
+
+            try:
+                return await self._async_fetch_price_pool(lotto_type, metrics)
+            except (TimeoutError, ClientError) as err:
+                metrics.record_error(err)
+            except _PARSE_ERRORS as err:
+                # Parse errors will not go away by retrying
+                metrics.record_error(err)
+                return None
+            finally:
+                metrics.last_request_latency = perf_counter() - start
+
+        return None
+
+    # ------------------------------------------------------
+    async def _async_fetch_price_pool(
+        self, lotto_type: LottoTypes, metrics: GameMetrics
+    ) -> int | None:
+        """Fetch price pool, trying the sources in order.
+
+        A source which fails to deliver a price pool, or can not be reached
+        within its own request timeout, falls back to the next source.
+        Transient errors of the last source are raised for retrying.
+        """
+
+        sources: list[tuple[PricePoolSource, str]] = [
+            (source, url)
+            for source in self.sources
+            if (url := source.url(lotto_type)) is not None
+        ]
+
+        for index, (source, url) in enumerate(sources):
+            try:
+                pool: int | None = await self._async_fetch_from_source(
+                    source, url, metrics
+                )
+            except (TimeoutError, ClientError, *_PARSE_ERRORS) as err:
+                if index == len(sources) - 1:
+                    raise
+                metrics.record_error(err)
+                continue
+
+            metrics.last_source = source.name
+            return pool
+
+        return None
+
+    # ------------------------------------------------------
+    async def _async_fetch_from_source(
+        self, source: PricePoolSource, url: str, metrics: GameMetrics
+    ) -> int | None:
+        """Fetch price pool from source in a single request."""
+
+        async with timeout(self.request_timeout):
+            response = await self.session.get(
+                url, headers=self.request_cache.request_headers(url)
+            )
+
+            if response.status == HTTPStatus.NOT_MODIFIED:
+                response.release()
+                metrics.not_modified += 1
+                metrics.record_success()
+                return self.request_cache.hit(url)
+
+            response.raise_for_status()
+            pool: int = await source.async_read(response, metrics)
+            self.request_cache.update(url, response.headers, pool)
+            metrics.record_success()
+            return pool
+
+    # ------------------------------------------------------
+    def update_scroll_texts(self) -> None:
+        """Precompute scroll texts for the selected games."""
+
+        self.lotto_price_pool_scroll_texts = {
+            lotto_type: game.name
+            + ": "
+            + str(int(self.get_price_pool(lotto_type) / 1000000))
+            + " mio"
+            for lotto_type, game in GAMES.items()
+            if lotto_type in self.selected
+        }
 
     # ------------------------------------------------------
     def roll_price_pools(self) -> None:
         """Roll price pools."""
 
         if (
-            self.get_euro_jackpot
-            and self.lotto_price_pool_scroll_next == LottoTypes.EURO_JACKPOT
-        ):
-            self.lotto_price_pool_scroll = (
-                "Euro jackpot: "
-                + str(int(self.euro_jackpot_price_pool / 1000000))
-                + " mio"
-            )
-        elif self.get_lotto and self.lotto_price_pool_scroll_next == LottoTypes.LOTTO:
-            self.lotto_price_pool_scroll = (
-                "Lotto: " + str(int(self.lotto_price_pool / 1000000)) + " mio"
-            )
-        elif (
-            self.get_viking_lotto
-            and self.lotto_price_pool_scroll_next == LottoTypes.VIKING_LOTTO
-        ):
-            self.lotto_price_pool_scroll = (
-                "Viking lotto: "
-                + str(int(self.viking_lotto_price_pool / 1000000))
-                + " mio"
+            text := self.lotto_price_pool_scroll_texts.get(
+                self.lotto_price_pool_scroll_next
             )
+        ) is not None:
+            self.lotto_price_pool_scroll = text
 
         self.find_next_lotto_scroll()
 
@@ -155,23 +750,6 @@ class ComponentApi:
     def find_next_lotto_scroll(self) -> None:
         """Roll price pools."""
 
-        if self.lotto_price_pool_scroll_next == LottoTypes.EURO_JACKPOT:
-            if self.get_lotto:
-                self.lotto_price_pool_scroll_next = LottoTypes.LOTTO
-            elif self.get_viking_lotto:
-                self.lotto_price_pool_scroll_next = LottoTypes.VIKING_LOTTO
-            return
-
-        if self.lotto_price_pool_scroll_next == LottoTypes.LOTTO:
-            if self.get_viking_lotto:
-                self.lotto_price_pool_scroll_next = LottoTypes.VIKING_LOTTO
-            elif self.get_euro_jackpot:
-                self.lotto_price_pool_scroll_next = LottoTypes.EURO_JACKPOT
-            return
-
-        if self.lotto_price_pool_scroll_next == LottoTypes.VIKING_LOTTO:
-            if self.get_euro_jackpot:
-                self.lotto_price_pool_scroll_next = LottoTypes.EURO_JACKPOT
-            elif self.get_lotto:
-                self.lotto_price_pool_scroll_next = LottoTypes.LOTTO
-            return
+        self.lotto_price_pool_scroll_next = self.scroll_successors.get(
+            self.lotto_price_pool_scroll_next, self.lotto_price_pool_scroll_next
+        )
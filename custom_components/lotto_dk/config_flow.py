@@ -17,14 +17,20 @@ from homeassistant.helpers.schema_config_entry_flow import (
 from homeassistant.util.uuid import random_uuid_hex
 
 from .const import (
-    CONF_EURO_JACKPOT,
     CONF_LISTEN_TO_TIMER_TRIGGER,
-    CONF_LOTTO,
     CONF_RESTART_TIMER,
-    CONF_VIKING_LOTTO,
+    CONF_RESULT_PATH,
+    CONF_RESULT_URL,
+    CONF_SOURCE,
+    CONF_SOURCE_PATH,
+    CONF_SOURCE_URL,
     DOMAIN,
     DOMAIN_NAME,
+    SOURCE_EMBEDDED_JSON,
+    SOURCE_JSON,
+    SOURCE_TITLE,
 )
+from .games import GAMES, selected_games
 
 
 # ------------------------------------------------------------------
@@ -33,29 +39,27 @@ async def _validate_input(
 ) -> dict[str, Any]:
     """Validate the user input."""
 
-    if (
-        user_input[CONF_EURO_JACKPOT] is False
-        and user_input[CONF_LOTTO] is False
-        and user_input[CONF_VIKING_LOTTO] is False
-    ):
+    if not selected_games(user_input):
         raise SchemaFlowError("missing_selection")
+
+    if user_input.get(CONF_SOURCE) == SOURCE_JSON:
+        if "{game}" not in user_input.get(CONF_SOURCE_URL, ""):
+            raise SchemaFlowError("missing_source_url")
+
+    if (result_url := user_input.get(CONF_RESULT_URL)) and "{game}" not in result_url:
+        raise SchemaFlowError("invalid_result_url")
     return user_input
 
 
 CONFIG_OPTIONS_SCHEMA = vol.Schema(
     {
-        vol.Required(
-            CONF_EURO_JACKPOT,
-            default=True,
-        ): cv.boolean,
-        vol.Required(
-            CONF_LOTTO,
-            default=True,
-        ): cv.boolean,
-        vol.Required(
-            CONF_VIKING_LOTTO,
-            default=True,
-        ): cv.boolean,
+        **{
+            vol.Required(
+                game.conf_key,
+                default=True,
+            ): cv.boolean
+            for game in GAMES.values()
+        },
         vol.Optional(
             CONF_LISTEN_TO_TIMER_TRIGGER,
         ): selector.EntitySelector(
@@ -65,6 +69,31 @@ CONFIG_OPTIONS_SCHEMA = vol.Schema(
             CONF_RESTART_TIMER,
             default=False,
         ): cv.boolean,
+        vol.Required(
+            CONF_SOURCE,
+            default=SOURCE_TITLE,
+        ): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[SOURCE_TITLE, SOURCE_EMBEDDED_JSON, SOURCE_JSON],
+                translation_key=CONF_SOURCE,
+            ),
+        ),
+        vol.Optional(
+            CONF_SOURCE_URL,
+        ): selector.TextSelector(
+            selector.TextSelectorConfig(type=selector.TextSelectorType.URL),
+        ),
+        vol.Optional(
+            CONF_SOURCE_PATH,
+        ): selector.TextSelector(),
+        vol.Optional(
+            CONF_RESULT_URL,
+        ): selector.TextSelector(
+            selector.TextSelectorConfig(type=selector.TextSelectorType.URL),
+        ),
+        vol.Optional(
+            CONF_RESULT_PATH,
+        ): selector.TextSelector(),
     }
 )
 
@@ -15,3 +15,19 @@ CONF_VIKING_LOTTO: str = "viking_lotto"
 
 CONF_RESTART_TIMER = "restart_timer"
 CONF_LISTEN_TO_TIMER_TRIGGER = "listen_to_timer_trigger"
+
+CONF_SOURCE = "source"
+CONF_SOURCE_URL = "source_url"
+CONF_SOURCE_PATH = "source_path"
+
+CONF_RESULT_URL = "result_url"
+CONF_RESULT_PATH = "result_path"
+
+SOURCE_TITLE = "title"
+SOURCE_EMBEDDED_JSON = "embedded_json"
+SOURCE_JSON = "json"
+
+SIGNAL_OPTIONS_UPDATED = f"{DOMAIN}_options_updated"
+
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
@@ -0,0 +1,43 @@
+"""Diagnostics support for Lotto DK."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import CommonConfigEntry
+from .games import GAMES
+
+
+# ------------------------------------------------------------------
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: CommonConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    component_api = entry.runtime_data.component_api
+
+    return {
+        "options": dict(entry.options),
+        "price_pools": {
+            GAMES[lotto_type].unique_id: {
+                "price_pool": price_pool.price_pool,
+                "fetched": price_pool.fetched,
+            }
+            for lotto_type, price_pool in component_api.price_pools.items()
+        },
+        "next_scrape": component_api.scrape_scheduler.next_scrape(
+            component_api.selected
+        ),
+        "request_cache": {
+            "hits": component_api.request_cache.hits,
+            "misses": component_api.request_cache.misses,
+            "entries": len(component_api.request_cache.entries),
+        },
+        "circuit_breakers": {
+            GAMES[lotto_type].unique_id: circuit_breaker.state
+            for lotto_type, circuit_breaker in component_api.circuit_breakers.items()
+        },
+        "metrics": component_api.metrics.as_dict(),
+    }
@@ -0,0 +1,167 @@
+"""Draw schedule aware scrape scheduler."""
+
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, tzinfo
+
+from homeassistant.util import dt as dt_util
+
+DRAW_TIME_ZONE = "Europe/Copenhagen"
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class DrawSchedule:
+    """Draw calendar for a game.
+
+    weekdays uses Monday == 0. draw_time is the local time from which a new
+    price pool can be expected on the site.
+    """
+
+    weekdays: tuple[int, ...]
+    draw_time: time
+
+    # ------------------------------------------------------------------
+    def _draw_on(self, day: datetime, tz: tzinfo) -> datetime:
+        """Return the draw datetime on the date of day."""
+
+        return datetime.combine(day.date(), self.draw_time, tzinfo=tz)
+
+    # ------------------------------------------------------------------
+    def last_draw(self, now: datetime, tz: tzinfo) -> datetime:
+        """Return the latest draw at or before now."""
+
+        local_now: datetime = now.astimezone(tz)
+
+        for days in range(8):
+            day: datetime = local_now - timedelta(days=days)
+
+            if day.weekday() in self.weekdays:
+                draw: datetime = self._draw_on(day, tz)
+
+                if draw <= local_now:
+                    return draw
+
+        raise ValueError("Draw schedule without weekdays")
+
+    # ------------------------------------------------------------------
+    def next_draw(self, now: datetime, tz: tzinfo) -> datetime:
+        """Return the first draw after now."""
+
+        local_now: datetime = now.astimezone(tz)
+
+        for days in range(8):
+            day: datetime = local_now + timedelta(days=days)
+
+            if day.weekday() in self.weekdays:
+                draw: datetime = self._draw_on(day, tz)
+
+                if draw > local_now:
+                    return draw
+
+        raise ValueError("Draw schedule without weekdays")
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class _ScrapeState:
+    """Scrape state for a game."""
+
+    next_scrape: datetime | None = None
+    picked_up_draw: datetime | None = None
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class ScrapeScheduler:
+    """Decide when each game should be scraped.
+
+    After a draw the game is polled every dense_interval until a new pool has
+    been seen or dense_window has passed. Otherwise it is polled every
+    idle_interval, but never later than the next draw.
+    """
+
+    def __init__(
+        self,
+        schedules: dict[Hashable, DrawSchedule],
+        dense_interval: timedelta = timedelta(minutes=10),
+        dense_window: timedelta = timedelta(hours=12),
+        idle_interval: timedelta = timedelta(hours=3),
+    ) -> None:
+        """Init."""
+
+        self.schedules: dict[Hashable, DrawSchedule] = schedules
+        self.dense_interval: timedelta = dense_interval
+        self.dense_window: timedelta = dense_window
+        self.idle_interval: timedelta = idle_interval
+        self.tz: tzinfo = dt_util.get_time_zone(DRAW_TIME_ZONE)
+        self._states: dict[Hashable, _ScrapeState] = {
+            key: _ScrapeState() for key in schedules
+        }
+
+    # ------------------------------------------------------------------
+    def due(self, keys: Iterable[Hashable], now: datetime) -> list[Hashable]:
+        """Return the keys which should be scraped now."""
+
+        return [
+            key
+            for key in keys
+            if (next_scrape := self._states[key].next_scrape) is None
+            or next_scrape <= now
+        ]
+
+    # ------------------------------------------------------------------
+    def register(
+        self, key: Hashable, now: datetime, changed: bool, failed: bool = False
+    ) -> datetime:
+        """Register a scrape of key and return when to scrape it next.
+
+        A failed scrape is retried after dense_interval.
+        """
+
+        schedule: DrawSchedule = self.schedules[key]
+        state: _ScrapeState = self._states[key]
+
+        if failed:
+            state.next_scrape = now + self.dense_interval
+            return state.next_scrape
+
+        last_draw: datetime = schedule.last_draw(now, self.tz)
+
+        if changed:
+            state.picked_up_draw = last_draw
+
+        if state.picked_up_draw != last_draw and now < last_draw + self.dense_window:
+            state.next_scrape = now + self.dense_interval
+        else:
+            state.next_scrape = min(
+                now + self.idle_interval,
+                schedule.next_draw(now, self.tz).astimezone(dt_util.UTC),
+            )
+
+        return state.next_scrape
+
+    # ------------------------------------------------------------------
+    def postpone(self, key: Hashable, until: datetime) -> None:
+        """Do not scrape key before until, e.g. while it is blocked."""
+
+        self._states[key].next_scrape = until
+
+    # ------------------------------------------------------------------
+    def next_scrape(self, keys: Iterable[Hashable]) -> datetime | None:
+        """Return the earliest next scrape of the given games.
+
+        Games left out, e.g. deselected ones, are never due again, so their
+        next scrape would stay in the past.
+        """
+
+        return min(
+            (
+                next_scrape
+                for key in keys
+                if (next_scrape := self._states[key].next_scrape) is not None
+            ),
+            default=None,
+        )
@@ -10,18 +10,19 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
+from .component_api import LottoData
 from .const import DOMAIN, DOMAIN_NAME
 
 
 # ------------------------------------------------------------------
-class ComponentEntity(CoordinatorEntity[DataUpdateCoordinator], Entity):
+class ComponentEntity(CoordinatorEntity[DataUpdateCoordinator[LottoData]], Entity):
     """Defines a Lotto entity."""
 
     _attr_has_entity_name = True
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: DataUpdateCoordinator[LottoData],
         entry: ConfigEntry,
     ) -> None:
         """Initialize the Lotto entity."""
@@ -0,0 +1,180 @@
+"""Game registry."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import time
+from enum import Enum
+from typing import Any
+
+from .const import CONF_EURO_JACKPOT, CONF_LOTTO, CONF_VIKING_LOTTO
+from .draw_schedule import DrawSchedule
+
+
+class LottoTypes(Enum):
+    """Lotto enum."""
+
+    LOTTO = 1
+    EURO_JACKPOT = 2
+    VIKING_LOTTO = 3
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class GameRules:
+    """Row and prize tier rules of a game.
+
+    A row has numbers out of 1..max_number and extra_numbers out of
+    1..max_extra. With extra_from_main the row has no extra numbers, they are
+    drawn from the remaining main numbers and matched against the row like
+    the Lotto tillaegstal. tiers holds (name, main hits, extra hits) best
+    first, extra hits None matches any.
+    """
+
+    numbers: int
+    max_number: int
+    extra_numbers: int
+    max_extra: int
+    tiers: tuple[tuple[str, int, int | None], ...]
+    extra_from_main: bool = False
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class Game:
+    """Descriptor of a game.
+
+    unique_id is also the key used in storage, metrics and diagnostics.
+    """
+
+    lotto_type: LottoTypes
+    conf_key: str
+    name: str
+    unique_id: str
+    url: str
+    schedule: DrawSchedule
+    rules: GameRules
+
+
+# Registry in scroll order. Adding a game is adding a descriptor here, a
+# LottoTypes member and an option translation.
+GAMES: Mapping[LottoTypes, Game] = {
+    game.lotto_type: game
+    for game in (
+        Game(
+            LottoTypes.EURO_JACKPOT,
+            CONF_EURO_JACKPOT,
+            "Euro jackpot",
+            "euro_jackpot",
+            "https://danskespil.dk/eurojackpot",
+            # Monday == 0, local Danish time from which a new pool can be expected
+            DrawSchedule((1, 4), time(21, 0)),
+            GameRules(
+                5,
+                50,
+                2,
+                12,
+                (
+                    ("5+2", 5, 2),
+                    ("5+1", 5, 1),
+                    ("5", 5, 0),
+                    ("4+2", 4, 2),
+                    ("4+1", 4, 1),
+                    ("4", 4, 0),
+                    ("3+2", 3, 2),
+                    ("2+2", 2, 2),
+                    ("3+1", 3, 1),
+                    ("3", 3, 0),
+                    ("1+2", 1, 2),
+                    ("2+1", 2, 1),
+                ),
+            ),
+        ),
+        Game(
+            LottoTypes.LOTTO,
+            CONF_LOTTO,
+            "Lotto",
+            "lotto",
+            "https://danskespil.dk/lotto",
+            DrawSchedule((5,), time(21, 0)),
+            GameRules(
+                7,
+                36,
+                1,
+                0,
+                (
+                    ("7", 7, None),
+                    ("6+1", 6, 1),
+                    ("6", 6, 0),
+                    ("5", 5, None),
+                    ("4+1", 4, 1),
+                ),
+                extra_from_main=True,
+            ),
+        ),
+        Game(
+            LottoTypes.VIKING_LOTTO,
+            CONF_VIKING_LOTTO,
+            "Viking lotto",
+            "viking_lotto",
+            "https://danskespil.dk/vikinglotto",
+            DrawSchedule((2,), time(20, 0)),
+            GameRules(
+                6,
+                48,
+                1,
+                5,
+                (
+                    ("6+1", 6, 1),
+                    ("6", 6, 0),
+                    ("5+1", 5, 1),
+                    ("5", 5, 0),
+                    ("4+1", 4, 1),
+                    ("4", 4, 0),
+                    ("3+1", 3, 1),
+                    ("3", 3, 0),
+                ),
+            ),
+        ),
+    )
+}
+
+GAME_IDS: Mapping[str, LottoTypes] = {
+    game.unique_id: lotto_type for lotto_type, game in GAMES.items()
+}
+
+
+# ------------------------------------------------------------------
+def selected_games(options: Mapping[str, Any]) -> frozenset[LottoTypes]:
+    """Return the games selected in the options.
+
+    Games added after the entry was created are not selected.
+    """
+
+    return frozenset(
+        lotto_type
+        for lotto_type, game in GAMES.items()
+        if options.get(game.conf_key, False)
+    )
+
+
+# ------------------------------------------------------------------
+def scroll_successors(
+    selected: frozenset[LottoTypes],
+) -> dict[LottoTypes, LottoTypes]:
+    """Precompute the next selected game in scroll order for every game.
+
+    The game itself is only its own successor when it is the only selected.
+    """
+
+    order: tuple[LottoTypes, ...] = tuple(GAMES)
+    successors: dict[LottoTypes, LottoTypes] = {}
+
+    for index, lotto_type in enumerate(order):
+        for offset in range(1, len(order) + 1):
+            if (candidate := order[(index + offset) % len(order)]) in selected:
+                successors[lotto_type] = candidate
+                break
+
+    return successors
@@ -0,0 +1,107 @@
+"""Scrape metrics."""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class GameMetrics:
+    """Fetch and parse metrics for a game."""
+
+    requests: int = 0
+    not_modified: int = 0
+    bytes_received: int = 0
+    last_request_latency: float | None = None
+    last_parse_time: float | None = None
+    last_success: datetime | None = None
+    last_source: str | None = None
+    errors: Counter[str] = field(default_factory=Counter)
+
+    # ------------------------------------------------------------------
+    def record_error(self, err: BaseException) -> None:
+        """Count error by class."""
+
+        self.errors[type(err).__name__] += 1
+
+    # ------------------------------------------------------------------
+    def record_success(self) -> None:
+        """Register a successful fetch."""
+
+        self.last_success = dt_util.utcnow()
+
+    # ------------------------------------------------------------------
+    def as_dict(self) -> dict:
+        """Return metrics as dict, the error counter as a plain dict."""
+
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "bytes_received": self.bytes_received,
+            "last_request_latency": self.last_request_latency,
+            "last_parse_time": self.last_parse_time,
+            "last_success": self.last_success,
+            "last_source": self.last_source,
+            "errors": dict(self.errors),
+        }
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class ScrapeMetrics:
+    """Metrics for the update path."""
+
+    games: dict[str, GameMetrics] = field(default_factory=dict)
+    refreshes: int = 0
+    last_refresh_duration: float | None = None
+    last_refresh: datetime | None = None
+    state_writes: int = 0
+    setup_duration: float | None = None
+
+    # ------------------------------------------------------------------
+    def game(self, name: str) -> GameMetrics:
+        """Get metrics for game."""
+
+        if (metrics := self.games.get(name)) is None:
+            metrics = self.games[name] = GameMetrics()
+
+        return metrics
+
+    # ------------------------------------------------------------------
+    def record_refresh(self, duration: float) -> None:
+        """Register a refresh cycle."""
+
+        self.refreshes += 1
+        self.last_refresh_duration = duration
+        self.last_refresh = dt_util.utcnow()
+
+    # ------------------------------------------------------------------
+    def last_success(self) -> datetime | None:
+        """Return the latest successful fetch of all games."""
+
+        return max(
+            (
+                metrics.last_success
+                for metrics in self.games.values()
+                if metrics.last_success is not None
+            ),
+            default=None,
+        )
+
+    # ------------------------------------------------------------------
+    def as_dict(self) -> dict:
+        """Return metrics as dict."""
+
+        return {
+            "games": {name: metrics.as_dict() for name, metrics in self.games.items()},
+            "refreshes": self.refreshes,
+            "last_refresh_duration": self.last_refresh_duration,
+            "last_refresh": self.last_refresh,
+            "state_writes": self.state_writes,
+            "setup_duration": self.setup_duration,
+        }
@@ -0,0 +1,77 @@
+"""Prize tier odds and expected values."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import cache
+from math import comb
+
+from .games import GameRules
+from .results import PrizeTier
+from .tickets import tier_table
+
+
+# ------------------------------------------------------------------
+def _extra_probability(rules: GameRules, main_hits: int, extra_hits: int) -> float:
+    """Return the probability of extra_hits given main_hits."""
+
+    if rules.extra_from_main:
+        # The extra numbers are drawn from the numbers left after the draw
+        left: int = rules.max_number - rules.numbers
+        row_left: int = rules.numbers - main_hits
+    else:
+        left = rules.max_extra
+        row_left = rules.extra_numbers
+
+    return (
+        comb(row_left, extra_hits)
+        * comb(left - row_left, rules.extra_numbers - extra_hits)
+        / comb(left, rules.extra_numbers)
+    )
+
+
+# ------------------------------------------------------------------
+@cache
+def tier_probabilities(rules: GameRules) -> dict[str, float]:
+    """Return the probability of each prize tier for one row.
+
+    Built once per game from the hypergeometric odds of the main and extra
+    hits, summed into the tiers of the tier table.
+    """
+
+    width: int = rules.extra_numbers + 1
+    table: tuple[str | None, ...] = tier_table(rules)
+    rows: int = comb(rules.max_number, rules.numbers)
+    probabilities: dict[str, float] = {name: 0.0 for name, _, _ in rules.tiers}
+
+    for main_hits in range(rules.numbers + 1):
+        main_probability: float = (
+            comb(rules.numbers, main_hits)
+            * comb(rules.max_number - rules.numbers, rules.numbers - main_hits)
+            / rows
+        )
+
+        for extra_hits in range(width):
+            if (tier := table[main_hits * width + extra_hits]) is not None:
+                probabilities[tier] += main_probability * _extra_probability(
+                    rules, main_hits, extra_hits
+                )
+
+    return probabilities
+
+
+# ------------------------------------------------------------------
+def prize_value(
+    probabilities: dict[str, float], prizes: Iterable[PrizeTier], jackpot_tier: str
+) -> float:
+    """Return the expected value of a row from the tiers below the jackpot.
+
+    The amounts are the payouts of a draw result, tiers without an amount
+    count as zero.
+    """
+
+    return sum(
+        probabilities[prize.name] * prize.amount
+        for prize in prizes
+        if prize.name != jackpot_tier and prize.name in probabilities
+    )
@@ -0,0 +1,106 @@
+"""Price pool history."""
+
+from array import array
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class PoolHistory:
+    """Fixed size, array backed ring buffer of price pools.
+
+    A sample is added each time the price pool changes, i.e. once per draw.
+    The trend values are kept up to date in O(1) per sample.
+    """
+
+    def __init__(self, size: int = 52) -> None:
+        """Init."""
+
+        self.size: int = size
+        self.pools: array = array("q", bytes(8 * size))
+        self.times: array = array("d", bytes(8 * size))
+        self.start: int = 0
+        self.count: int = 0
+        self.rollovers: int = 0
+
+    # ------------------------------------------------------------------
+    def _index(self, back: int) -> int:
+        """Return buffer index of the sample back steps from the newest."""
+
+        return (self.start + self.count - 1 - back) % self.size
+
+    # ------------------------------------------------------------------
+    def add(self, pool: int, fetched: datetime) -> bool:
+        """Add price pool if it differs from the newest sample.
+
+        Returns:
+            bool: True if a sample was added
+
+        """
+
+        if self.count and self.pools[self._index(0)] == pool:
+            return False
+
+        if self.count:
+            self.rollovers = (
+                self.rollovers + 1 if pool > self.pools[self._index(0)] else 0
+            )
+
+        if self.count < self.size:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.size
+
+        index: int = self._index(0)
+        self.pools[index] = pool
+        self.times[index] = fetched.timestamp()
+        return True
+
+    # ------------------------------------------------------------------
+    @property
+    def change_since_last_draw(self) -> int | None:
+        """Change of the price pool since the previous draw."""
+
+        if self.count < 2:
+            return None
+
+        return self.pools[self._index(0)] - self.pools[self._index(1)]
+
+    # ------------------------------------------------------------------
+    @property
+    def growth_per_draw(self) -> float | None:
+        """Average change of the price pool per draw over the history."""
+
+        if self.count < 2:
+            return None
+
+        newest: int = self.pools[self._index(0)]
+        oldest: int = self.pools[self._index(self.count - 1)]
+        return (newest - oldest) / (self.count - 1)
+
+    # ------------------------------------------------------------------
+    def as_dict(self) -> dict:
+        """Return history as dict, oldest sample first."""
+
+        indexes: list[int] = [
+            self._index(back) for back in range(self.count - 1, -1, -1)
+        ]
+
+        return {
+            "pools": [self.pools[index] for index in indexes],
+            "times": [self.times[index] for index in indexes],
+        }
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_dict(cls, data: dict, size: int = 52) -> "PoolHistory":
+        """Create history from dict."""
+
+        history: PoolHistory = cls(size)
+
+        for pool, timestamp in zip(data["pools"], data["times"], strict=True):
+            history.add(pool, dt_util.utc_from_timestamp(timestamp))
+
+        return history
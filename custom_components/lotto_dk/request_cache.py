@@ -0,0 +1,73 @@
+"""Conditional request cache."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from aiohttp import hdrs
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(slots=True)
+class RequestCacheEntry:
+    """Validators and last parsed price pool for an url."""
+
+    etag: str | None
+    last_modified: str | None
+    price_pool: int
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class RequestCache:
+    """Per url ETag/Last-Modified validator cache."""
+
+    def __init__(self) -> None:
+        """Init."""
+
+        self.entries: dict[str, RequestCacheEntry] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    # ------------------------------------------------------------------
+    def request_headers(self, url: str) -> dict[str, str]:
+        """Return conditional request headers for url."""
+
+        headers: dict[str, str] = {}
+
+        if (entry := self.entries.get(url)) is None:
+            return headers
+
+        if entry.etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = entry.etag
+
+        if entry.last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = entry.last_modified
+
+        return headers
+
+    # ------------------------------------------------------------------
+    def hit(self, url: str) -> int | None:
+        """Register a not modified response and return the cached price pool."""
+
+        self.hits += 1
+
+        if (entry := self.entries.get(url)) is None:
+            return None
+
+        return entry.price_pool
+
+    # ------------------------------------------------------------------
+    def update(self, url: str, headers: Mapping[str, str], price_pool: int) -> None:
+        """Register a full response and store its validators."""
+
+        self.misses += 1
+
+        etag: str | None = headers.get(hdrs.ETAG)
+        last_modified: str | None = headers.get(hdrs.LAST_MODIFIED)
+
+        if price_pool == 0 or (etag is None and last_modified is None):
+            self.entries.pop(url, None)
+            return
+
+        self.entries[url] = RequestCacheEntry(etag, last_modified, price_pool)
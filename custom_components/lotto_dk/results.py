@@ -0,0 +1,110 @@
+"""Draw results."""
+
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from time import perf_counter
+from typing import Any
+
+from aiohttp.client import ClientResponse
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.json import json_loads
+
+from .metrics import GameMetrics
+from .sources import compile_lookup
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class PrizeTier:
+    """Payout for a prize tier."""
+
+    name: str
+    winners: int
+    amount: int
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class DrawResult:
+    """Result of a draw."""
+
+    draw_date: date
+    numbers: tuple[int, ...]
+    extra_numbers: tuple[int, ...] = ()
+    prizes: tuple[PrizeTier, ...] = ()
+
+    # ------------------------------------------------------------------
+    def as_dict(self) -> dict:
+        """Return result as dict."""
+
+        return {
+            "draw_date": self.draw_date.isoformat(),
+            "numbers": list(self.numbers),
+            "extra_numbers": list(self.extra_numbers),
+            "prizes": [
+                {"name": prize.name, "winners": prize.winners, "amount": prize.amount}
+                for prize in self.prizes
+            ],
+        }
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "DrawResult":
+        """Create result from dict."""
+
+        return cls(
+            date.fromisoformat(str(data["draw_date"])[:10]),
+            tuple(int(number) for number in data["numbers"]),
+            tuple(int(number) for number in data.get("extra_numbers", ())),
+            tuple(
+                PrizeTier(
+                    str(prize["name"]), int(prize["winners"]), int(prize["amount"])
+                )
+                for prize in data.get("prizes", ())
+            ),
+        )
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class ResultSource:
+    """Draw result from a JSON document.
+
+    path points at an object with draw_date, numbers, extra_numbers and
+    prizes, the same layout as DrawResult.as_dict.
+    """
+
+    name = "result_json"
+
+    def __init__(
+        self, hass: HomeAssistant, urls: Mapping[Hashable, str], path: str
+    ) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.urls: Mapping[Hashable, str] = urls
+        self._lookup: Callable[[Any], Any] = compile_lookup(path)
+
+    # ------------------------------------------------------------------
+    def url(self, key: Hashable) -> str | None:
+        """Return url for key, None if the source does not cover it."""
+
+        return self.urls.get(key)
+
+    # ------------------------------------------------------------------
+    async def async_read(
+        self, response: ClientResponse, metrics: GameMetrics
+    ) -> DrawResult:
+        """Read draw result from response."""
+
+        body: bytes = await response.read()
+        metrics.bytes_received += len(body)
+
+        start: float = perf_counter()
+        result: DrawResult = DrawResult.from_dict(self._lookup(json_loads(body)))
+        metrics.last_parse_time = perf_counter() - start
+        return result
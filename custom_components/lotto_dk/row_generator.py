@@ -0,0 +1,262 @@
+"""Generation of random and system rows."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from functools import cache
+from itertools import combinations, islice, product
+from math import comb
+from pathlib import Path
+import random
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .games import GameRules
+
+INLINE_ROWS_MAX = 1000
+ROWS_MAX = 1000000
+ROWS_CHUNK_SIZE = 10000
+
+# Approximate memory of a rank in a set, int object and table slot
+_SET_ENTRY_SIZE = 64
+
+_NUMBER_TEXTS: list[str] = [str(number) for number in range(100)]
+
+
+# ------------------------------------------------------------------
+def format_row(numbers: Iterable[int], extra_numbers: Iterable[int]) -> str:
+    """Return a row in the check_tickets format, e.g. "3 12 17 28 44 + 2 9"."""
+
+    text: str = " ".join(map(str, sorted(numbers)))
+
+    if extra_text := " ".join(map(str, sorted(extra_numbers))):
+        return text + " + " + extra_text
+
+    return text
+
+
+# ------------------------------------------------------------------
+def _row_extras(rules: GameRules) -> int:
+    """Return the number of extra numbers on a row."""
+
+    return 0 if rules.extra_from_main else rules.extra_numbers
+
+
+# ------------------------------------------------------------------
+@cache
+def _rank_tables(rules: GameRules) -> tuple[tuple[list[int], ...], list[str]]:
+    """Precompute the tables to turn a row rank into a row, once per game.
+
+    The number tables hold comb(c, i) for i from numbers down to 1, a rank
+    is turned into numbers by the combinatorial number system. The extra
+    numbers have few combinations, their texts are listed by rank.
+    """
+
+    return (
+        tuple(
+            [comb(c, i) for c in range(rules.max_number)]
+            for i in range(rules.numbers, 0, -1)
+        ),
+        [
+            " + " + " ".join(map(str, extra_row)) if extra_row else ""
+            for extra_row in combinations(
+                range(1, rules.max_extra + 1), _row_extras(rules)
+            )
+        ],
+    )
+
+
+# ------------------------------------------------------------------
+def _unique_ranks(total: int, count: int) -> Iterator[int]:
+    """Yield count unique random ranks below total.
+
+    The seen ranks are kept in a set for small counts, and in a bitmap over
+    all ranks when that is smaller than the set.
+    """
+
+    randrange = random.Random().randrange
+
+    if count * _SET_ENTRY_SIZE < total // 8:
+        seen: set[int] = set()
+
+        while len(seen) < count:
+            if (rank := randrange(total)) not in seen:
+                seen.add(rank)
+                yield rank
+
+        return
+
+    bitmap: bytearray = bytearray((total + 7) // 8)
+    produced: int = 0
+
+    while produced < count:
+        rank = randrange(total)
+        byte: int = rank >> 3
+        bit: int = 1 << (rank & 7)
+
+        if bitmap[byte] & bit:
+            continue
+
+        bitmap[byte] |= bit
+        produced += 1
+        yield rank
+
+
+# ------------------------------------------------------------------
+def random_rows(rules: GameRules, count: int) -> Iterator[str]:
+    """Return count unique random rows, generated while iterating.
+
+    Every row of the game has a rank, a random rank is a random row.
+
+    Raises:
+        ValueError: If the game has fewer than count different rows
+
+    """
+
+    number_tables, extra_texts = _rank_tables(rules)
+    total: int = comb(rules.max_number, rules.numbers) * len(extra_texts)
+
+    if count > total:
+        raise ValueError(f"the game has fewer than {count} different rows")
+
+    return _ranked_rows(number_tables, extra_texts, _unique_ranks(total, count))
+
+
+# ------------------------------------------------------------------
+def _ranked_rows(
+    number_tables: tuple[list[int], ...], extra_texts: list[str], ranks: Iterator[int]
+) -> Iterator[str]:
+    """Yield the row of each rank."""
+
+    for rank in ranks:
+        rank, extra_rank = divmod(rank, len(extra_texts))
+        row: list[str] = []
+
+        for table in number_tables:
+            number: int = bisect_right(table, rank) - 1
+            rank -= table[number]
+            row.append(_NUMBER_TEXTS[number + 1])
+
+        row.reverse()
+        yield " ".join(row) + extra_texts[extra_rank]
+
+
+# ------------------------------------------------------------------
+def system_rows(
+    rules: GameRules,
+    numbers: list[int],
+    extra_numbers: list[int],
+    count: int | None,
+) -> Iterator[str]:
+    """Return the rows of a system, all combinations of the chosen numbers.
+
+    The rows are generated while iterating. Without a count the system may
+    have at most ROWS_MAX rows.
+
+    Raises:
+        ValueError: If the chosen numbers do not follow the rules of the game
+            or the system has too many rows
+
+    """
+
+    row_extras: int = _row_extras(rules)
+
+    for chosen, required, max_number in (
+        (numbers, rules.numbers, rules.max_number),
+        (extra_numbers, row_extras, rules.max_extra),
+    ):
+        if len(set(chosen)) != len(chosen) or len(chosen) < required:
+            raise ValueError(
+                f"a system needs at least {required} different numbers, got {chosen}"
+            )
+
+        if chosen and not 1 <= min(chosen) <= max(chosen) <= max_number:
+            raise ValueError(f"number out of range in {chosen}")
+
+    total: int = comb(len(numbers), rules.numbers) * comb(
+        len(extra_numbers), row_extras
+    )
+
+    if count is None and total > ROWS_MAX:
+        raise ValueError(
+            f"the system has {total} rows, more than {ROWS_MAX}, give a count"
+        )
+
+    rows: Iterator[tuple[tuple[int, ...], tuple[int, ...]]] = product(
+        combinations(sorted(numbers), rules.numbers),
+        combinations(sorted(extra_numbers), row_extras),
+    )
+
+    return (format_row(row, extra_row) for row, extra_row in islice(rows, count))
+
+
+# ------------------------------------------------------------------
+def _write_rows(path: Path, rows: Iterator[str]) -> int:
+    """Write rows to a file in chunks, run in the executor.
+
+    Returns:
+        int: Number of rows written
+
+    """
+
+    written: int = 0
+
+    with path.open("w", encoding="utf-8") as file:
+        while chunk := list(islice(rows, ROWS_CHUNK_SIZE)):
+            file.write("\n".join(chunk) + "\n")
+            written += len(chunk)
+
+    return written
+
+
+# ------------------------------------------------------------------
+def _inline_rows(rows: Iterator[str]) -> list[str]:
+    """Return rows for the response, run in the executor."""
+
+    inline: list[str] = list(islice(rows, INLINE_ROWS_MAX + 1))
+
+    if len(inline) > INLINE_ROWS_MAX:
+        raise ValueError(f"more than {INLINE_ROWS_MAX} rows needs a file")
+
+    return inline
+
+
+# ------------------------------------------------------------------
+async def async_generate_rows(
+    hass: HomeAssistant,
+    rules: GameRules,
+    count: int | None,
+    system: list[int] | None,
+    system_extra: list[int] | None,
+    file: str | None,
+) -> dict[str, Any]:
+    """Generate random rows or the rows of a system.
+
+    Rows are returned in the response, or streamed to a local file in chunks
+    of ROWS_CHUNK_SIZE for large outputs.
+    """
+
+    if file is not None and not hass.config.is_allowed_path(file):
+        raise HomeAssistantError(f"Access to '{file}' is not allowed")
+
+    try:
+        if system is not None:
+            rows: Iterator[str] = system_rows(rules, system, system_extra or [], count)
+        elif count is not None:
+            rows = random_rows(rules, count)
+        else:
+            raise ValueError("either count or system is needed")
+
+        if file is None:
+            return {"rows": await hass.async_add_executor_job(_inline_rows, rows)}
+
+        written: int = await hass.async_add_executor_job(_write_rows, Path(file), rows)
+    except OSError as err:
+        raise HomeAssistantError(f"Could not write '{file}': {err}") from err
+    except ValueError as err:
+        raise HomeAssistantError(f"Invalid rows: {err}") from err
+
+    return {"rows": written, "file": file}
@@ -2,26 +2,33 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-from homeassistant.components.sensor import (  # SensorDeviceClass,; SensorEntityDescription,
+from homeassistant.components.sensor import (  # SensorEntityDescription,
+    SensorDeviceClass,
     SensorEntity,
+    SensorStateClass,
 )
-from homeassistant.core import Event, HomeAssistant
-from homeassistant.helpers import issue_registry as ir, start
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er, issue_registry as ir, start
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import CommonConfigEntry
-from .component_api import LottoTypes
+from . import CommonConfigEntry, missing_timer_issue_id
+from .component_api import PricePool
 from .const import (
     CONF_LISTEN_TO_TIMER_TRIGGER,
     CONF_RESTART_TIMER,
     DOMAIN,
-    DOMAIN_NAME,
+    SIGNAL_OPTIONS_UPDATED,
     TRANSLATION_KEY,
     TRANSLATION_KEY_MISSING_TIMER_ENTITY,
 )
 from .entity import ComponentEntity
+from .games import GAMES, GameRules, LottoTypes
+from .odds import prize_value, tier_probabilities
+from .results import DrawResult
 from .timer_trigger import TimerTrigger, TimerTriggerErrorEnum
 
 
@@ -33,30 +40,105 @@ async def async_setup_entry(
 ) -> None:
     """Sensor setup."""
 
+    component_api = entry.runtime_data.component_api
+    game_sensors: dict[LottoTypes, list[SensorEntity]] = {}
+    result_sensors: dict[LottoTypes, LottoResultSensor] = {}
+    scroll_sensors: list[LottoScrollSensor] = [LottoScrollSensor(hass, entry)]
+
+    def create_game_sensors(lotto_type: LottoTypes) -> list[SensorEntity]:
+        """Create the sensors of a game."""
+
+        game_sensors[lotto_type] = [
+            LottoSensor(hass, entry, lotto_type),
+            LottoOddsSensor(hass, entry, lotto_type),
+        ]
+        return game_sensors[lotto_type]
+
+    def has_result_sensor(lotto_type: LottoTypes) -> bool:
+        """Return if the game should have a result sensor.
+
+        Only games with a result source get one, otherwise it would stay
+        unknown.
+        """
+
+        return component_api.is_selected(lotto_type) and (
+            component_api.has_result_source(lotto_type)
+        )
+
     sensors = []
 
-    # Euro jackpot
-    if entry.runtime_data.component_api.get_euro_jackpot:
-        sensors.append(LottoSensor(hass, entry, LottoTypes.EURO_JACKPOT))
+    for lotto_type in GAMES:
+        if component_api.is_selected(lotto_type):
+            sensors.extend(create_game_sensors(lotto_type))
 
-    # Lotto
-    if entry.runtime_data.component_api.get_lotto:
-        sensors.append(LottoSensor(hass, entry, LottoTypes.LOTTO))
+        if has_result_sensor(lotto_type):
+            result_sensors[lotto_type] = LottoResultSensor(hass, entry, lotto_type)
+            sensors.append(result_sensors[lotto_type])
 
-    # Viking Lotto
-    if entry.runtime_data.component_api.get_viking_lotto:
-        sensors.append(LottoSensor(hass, entry, LottoTypes.VIKING_LOTTO))
+    sensors.extend(scroll_sensors)
 
-    sensors.append(LottoScrollSensor(hass, entry))
+    # Diagnostic sensors, disabled by default
+    sensors.append(LottoRefreshDurationSensor(hass, entry))
+    sensors.append(LottoLastScrapeSensor(hass, entry))
 
     async_add_entities(sensors)
 
+    # ------------------------------------------------------
+    async def async_remove_sensor(sensor: SensorEntity) -> None:
+        """Remove a sensor and its registry entry, it is not restored later."""
+
+        entity_registry: er.EntityRegistry = er.async_get(hass)
+
+        if entity_registry.async_get(sensor.entity_id) is not None:
+            entity_registry.async_remove(sensor.entity_id)
+        else:
+            await sensor.async_remove()
+
+    # ------------------------------------------------------
+    async def async_options_updated(timer_changed: bool) -> None:
+        """Add or remove game sensors and rebind the scroll timer in place."""
+
+        new_sensors = []
+
+        for lotto_type in GAMES:
+            selected: bool = component_api.is_selected(lotto_type)
+
+            if selected and lotto_type not in game_sensors:
+                new_sensors.extend(create_game_sensors(lotto_type))
+            elif not selected and lotto_type in game_sensors:
+                for sensor in game_sensors.pop(lotto_type):
+                    await async_remove_sensor(sensor)
+
+            if has_result_sensor(lotto_type):
+                if lotto_type not in result_sensors:
+                    result_sensors[lotto_type] = LottoResultSensor(
+                        hass, entry, lotto_type
+                    )
+                    new_sensors.append(result_sensors[lotto_type])
+            elif lotto_type in result_sensors:
+                await async_remove_sensor(result_sensors.pop(lotto_type))
+
+        if timer_changed:
+            await scroll_sensors[0].async_remove()
+            scroll_sensors[0] = LottoScrollSensor(hass, entry)
+            new_sensors.append(scroll_sensors[0])
+
+        if new_sensors:
+            async_add_entities(new_sensors)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_OPTIONS_UPDATED, async_options_updated)
+    )
+
 
 # ------------------------------------------------------
 # ------------------------------------------------------
 class LottoSensor(ComponentEntity, SensorEntity):
     """Sensor class for lotto."""
 
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+
     # ------------------------------------------------------
     def __init__(
         self,
@@ -73,18 +155,11 @@ class LottoSensor(ComponentEntity, SensorEntity):
         self.component_api = entry.runtime_data.component_api
         self.coordinator = entry.runtime_data.coordinator
         self.lotto_type = lotto_type
+        self._last_written: tuple[bool, int | None] | None = None
 
         self.translation_key = TRANSLATION_KEY
-
-        if self.lotto_type == LottoTypes.EURO_JACKPOT:
-            self._name = "Euro jackpot"
-            self._unique_id = "euro_jackpot"
-        elif self.lotto_type == LottoTypes.VIKING_LOTTO:
-            self._name = "Viking lotto"
-            self._unique_id = "viking_lotto"
-        else:
-            self._name = "Lotto"
-            self._unique_id = "lotto"
+        self._name = GAMES[lotto_type].name
+        self._unique_id = GAMES[lotto_type].unique_id
 
     # ------------------------------------------------------
     @property
@@ -100,20 +175,17 @@ class LottoSensor(ComponentEntity, SensorEntity):
 
     # ------------------------------------------------------
     @property
-    def native_value(self) -> str | None:
+    def native_value(self) -> int | None:
         """Native value.
 
         Returns:
-            str | None: Native value
+            int | None: Native value
 
         """
-        match self.lotto_type:
-            case LottoTypes.EURO_JACKPOT:
-                return str(int(self.component_api.euro_jackpot_price_pool / 1000000))
-            case LottoTypes.VIKING_LOTTO:
-                return str(int(self.component_api.viking_lotto_price_pool / 1000000))
-            case _:
-                return str(int(self.component_api.lotto_price_pool / 1000000))
+        if (price_pool := self._price_pool()) is None:
+            return None
+
+        return int(price_pool.price_pool / 1000000)
 
     # ------------------------------------------------------
     @property
@@ -133,14 +205,22 @@ class LottoSensor(ComponentEntity, SensorEntity):
         """
         attr: dict = {}
 
-        if self.lotto_type == LottoTypes.EURO_JACKPOT:
-            attr["price_pool"] = self.component_api.euro_jackpot_price_pool
-        elif self.lotto_type == LottoTypes.VIKING_LOTTO:
-            attr["price_pool"] = self.component_api.viking_lotto_price_pool
-        else:
-            attr["price_pool"] = self.component_api.lotto_price_pool
+        if (price_pool := self._price_pool()) is not None:
+            attr["price_pool"] = price_pool.price_pool
+            attr["change_since_last_draw"] = price_pool.change_since_last_draw
+            attr["growth_per_draw"] = price_pool.growth_per_draw
+            attr["rollovers"] = price_pool.rollovers
         return attr
 
+    # ------------------------------------------------------
+    def _price_pool(self) -> PricePool | None:
+        """Price pool snapshot for the lotto type."""
+
+        if self.coordinator.data is None:
+            return None
+
+        return self.coordinator.data.get(self.lotto_type)
+
     # ------------------------------------------------------
     @property
     def unique_id(self) -> str:
@@ -173,9 +253,271 @@ class LottoSensor(ComponentEntity, SensorEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    # ------------------------------------------------------
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when price pool or availability has changed."""
+
+        price_pool: PricePool | None = self._price_pool()
+        current: tuple[bool, int | None] = (
+            self.available,
+            price_pool.price_pool if price_pool is not None else None,
         )
 
+        if current == self._last_written:
+            return
+
+        self._last_written = current
+        self.component_api.metrics.state_writes += 1
+        self.async_write_ha_state()
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class LottoResultSensor(ComponentEntity, SensorEntity):
+    """Sensor class for lotto draw result."""
+
+    _attr_device_class = SensorDeviceClass.DATE
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: CommonConfigEntry,
+        lotto_type: LottoTypes,
+    ) -> None:
+        """Lotto result sensor."""
+
+        super().__init__(entry.runtime_data.coordinator, entry)
+
+        self.hass: HomeAssistant = hass
+        self.entry: CommonConfigEntry = entry
+        self.component_api = entry.runtime_data.component_api
+        self.coordinator = entry.runtime_data.coordinator
+        self.lotto_type = lotto_type
+        self._last_written: tuple[bool, DrawResult | None] | None = None
+
+        self._name = GAMES[lotto_type].name + " vindertal"
+        self._unique_id = GAMES[lotto_type].unique_id + "_result"
+
+    # ------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name."""
+        return self._name
+
+    # ------------------------------------------------------
+    @property
+    def native_value(self) -> date | None:
+        """Native value."""
+
+        if (result := self.component_api.results.get(self.lotto_type)) is None:
+            return None
+
+        return result.draw_date
+
+    # ------------------------------------------------------
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Extra state attributes."""
+
+        if (result := self.component_api.results.get(self.lotto_type)) is None:
+            return {}
+
+        attr: dict = result.as_dict()
+        del attr["draw_date"]
+        return attr
+
+    # ------------------------------------------------------
+    @property
+    def unique_id(self) -> str:
+        """Unique id."""
+        return self._unique_id
+
+    # ------------------------------------------------------
+    @property
+    def should_poll(self) -> bool:
+        """No need to poll. Coordinator notifies entity of updates."""
+        return False
+
+    # ------------------------------------------------------
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    # ------------------------------------------------------
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the draw result or availability has changed."""
+
+        current: tuple[bool, DrawResult | None] = (
+            self.available,
+            self.component_api.results.get(self.lotto_type),
+        )
+
+        if current == self._last_written:
+            return
+
+        self._last_written = current
+        self.component_api.metrics.state_writes += 1
+        self.async_write_ha_state()
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class LottoOddsSensor(ComponentEntity, SensorEntity):
+    """Sensor class for the odds and jackpot expected value of a row."""
+
+    _attr_suggested_display_precision = 2
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: CommonConfigEntry,
+        lotto_type: LottoTypes,
+    ) -> None:
+        """Lotto odds sensor.
+
+        The tier probabilities are built once per game, only the expected
+        values are recalculated when the price pool or draw result changes.
+        """
+
+        super().__init__(entry.runtime_data.coordinator, entry)
+
+        self.hass: HomeAssistant = hass
+        self.entry: CommonConfigEntry = entry
+        self.component_api = entry.runtime_data.component_api
+        self.coordinator = entry.runtime_data.coordinator
+        self.lotto_type = lotto_type
+        self._last_inputs: tuple[bool, int | None, DrawResult | None] | None = None
+        self._value: float | None = None
+
+        self.translation_key = TRANSLATION_KEY
+        self._name = GAMES[lotto_type].name + " forventet jackpot gevinst"
+        self._unique_id = GAMES[lotto_type].unique_id + "_jackpot_expected_value"
+
+        rules: GameRules = GAMES[lotto_type].rules
+        self._probabilities: dict[str, float] = tier_probabilities(rules)
+        self._jackpot_tier: str = rules.tiers[0][0]
+        self._attributes: dict = {
+            "jackpot_odds": round(1 / self._probabilities[self._jackpot_tier]),
+            "prize_odds": round(1 / sum(self._probabilities.values()), 1),
+            "tier_odds": {
+                tier: round(1 / probability, 1)
+                for tier, probability in self._probabilities.items()
+            },
+            "lower_tiers_expected_value": None,
+        }
+
+    # ------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name."""
+        return self._name
+
+    # ------------------------------------------------------
+    @property
+    def native_value(self) -> float | None:
+        """Native value."""
+        return self._value
+
+    # ------------------------------------------------------
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Return the unit the value is expressed in."""
+
+        return "kr"
+
+    # ------------------------------------------------------
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Extra state attributes."""
+        return self._attributes
+
+    # ------------------------------------------------------
+    @property
+    def unique_id(self) -> str:
+        """Unique id."""
+        return self._unique_id
+
+    # ------------------------------------------------------
+    @property
+    def should_poll(self) -> bool:
+        """No need to poll. Coordinator notifies entity of updates."""
+        return False
+
+    # ------------------------------------------------------
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+        self._recalculate()
+
+    # ------------------------------------------------------
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the expected value inputs have changed."""
+
+        if not self._recalculate():
+            return
+
+        self.component_api.metrics.state_writes += 1
+        self.async_write_ha_state()
+
+    # ------------------------------------------------------
+    def _recalculate(self) -> bool:
+        """Recalculate the expected values when the pool or result has changed.
+
+        The state is the expected value of the jackpot, its odds times the
+        price pool. The lower tiers are pari-mutuel, their payouts are not
+        known before the draw. Their expected value from the payouts of the
+        latest draw result is an attribute, when a result source is set up.
+
+        Returns:
+            bool: If anything has changed
+
+        """
+
+        price_pool: PricePool | None = (
+            self.coordinator.data.get(self.lotto_type)
+            if self.coordinator.data is not None
+            else None
+        )
+        result: DrawResult | None = self.component_api.results.get(self.lotto_type)
+        inputs: tuple[bool, int | None, DrawResult | None] = (
+            self.available,
+            price_pool.price_pool if price_pool is not None else None,
+            result,
+        )
+
+        if inputs == self._last_inputs:
+            return False
+
+        if self._last_inputs is None or result != self._last_inputs[2]:
+            self._attributes["lower_tiers_expected_value"] = (
+                round(
+                    prize_value(self._probabilities, result.prizes, self._jackpot_tier),
+                    2,
+                )
+                if result is not None
+                else None
+            )
+
+        self._last_inputs = inputs
+        self._value = (
+            round(self._probabilities[self._jackpot_tier] * price_pool.price_pool, 2)
+            if price_pool is not None
+            else None
+        )
+        return True
+
 
 # ------------------------------------------------------
 # ------------------------------------------------------
@@ -197,6 +539,7 @@ class LottoScrollSensor(ComponentEntity, SensorEntity):
         self.coordinator = entry.runtime_data.coordinator
         self._name = "Lotto puljer"
         self._unique_id = "lotto_puljer"
+        self._issue_id = missing_timer_issue_id(entry)
 
         self.timer_trigger = TimerTrigger(
             self,
@@ -206,36 +549,53 @@ class LottoScrollSensor(ComponentEntity, SensorEntity):
                 minutes=1,
             ),
             auto_restart=self.entry.options.get(CONF_RESTART_TIMER, ""),
+            coalesce_window=timedelta(seconds=10),
+            callback_recovered=self.async_delete_issue,
         )
-        self.coordinator.update_interval = None
 
     # ------------------------------------------------------------------
     async def async_handle_timer_finished(self, error: TimerTriggerErrorEnum) -> None:
         """Handle timer finished."""
 
+        issue_registry: ir.IssueRegistry = ir.async_get(self.hass)
+
         if error:
             match error:
                 case TimerTriggerErrorEnum.MISSING_TIMER_ENTITY:
-                    ir.async_create_issue(
-                        self.hass,
-                        DOMAIN,
-                        DOMAIN_NAME + datetime.now().isoformat(),
-                        issue_domain=DOMAIN,
-                        is_fixable=False,
-                        severity=ir.IssueSeverity.WARNING,
-                        translation_key=TRANSLATION_KEY_MISSING_TIMER_ENTITY,
-                        translation_placeholders={
-                            "timer_entity": self.entry.options.get(
-                                CONF_LISTEN_TO_TIMER_TRIGGER, ""
-                            ),
-                            "entity": self.entity_id,
-                        },
-                    )
+                    # One issue per entry and timer entity, only reported once
+                    if issue_registry.async_get_issue(DOMAIN, self._issue_id) is None:
+                        ir.async_create_issue(
+                            self.hass,
+                            DOMAIN,
+                            self._issue_id,
+                            issue_domain=DOMAIN,
+                            is_fixable=False,
+                            severity=ir.IssueSeverity.WARNING,
+                            translation_key=TRANSLATION_KEY_MISSING_TIMER_ENTITY,
+                            translation_placeholders={
+                                "timer_entity": self.entry.options.get(
+                                    CONF_LISTEN_TO_TIMER_TRIGGER, ""
+                                ),
+                                "entity": self.entity_id,
+                            },
+                        )
                 case _:
                     pass
             return
 
-        await self.coordinator.async_refresh()
+        self.async_delete_issue()
+
+        self.component_api.roll_price_pools()
+        self.component_api.metrics.state_writes += 1
+        self.async_write_ha_state()
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_delete_issue(self) -> None:
+        """Delete the missing timer issue, the timer is back."""
+
+        if ir.async_get(self.hass).async_get_issue(DOMAIN, self._issue_id) is not None:
+            ir.async_delete_issue(self.hass, DOMAIN, self._issue_id)
 
     # ------------------------------------------------------
     @property
@@ -298,11 +658,112 @@ class LottoScrollSensor(ComponentEntity, SensorEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
 
         self.async_on_remove(start.async_at_started(self.hass, self.async_hass_started))
 
+    # ------------------------------------------------------
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Scroll text is rolled by the timer trigger, only fill it initially."""
+
+        if self.component_api.lotto_price_pool_scroll == "":
+            self.component_api.roll_price_pools()
+
+        self.component_api.metrics.state_writes += 1
+        self.async_write_ha_state()
+
     # ------------------------------------------------------
     async def async_hass_started(self, _event: Event) -> None:
         """Hass started."""
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class LottoRefreshDurationSensor(ComponentEntity, SensorEntity):
+    """Diagnostic sensor with the duration of the last refresh."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: CommonConfigEntry,
+    ) -> None:
+        """Refresh duration sensor."""
+        super().__init__(entry.runtime_data.coordinator, entry)
+
+        self.hass: HomeAssistant = hass
+        self.component_api = entry.runtime_data.component_api
+        self._name = "Refresh duration"
+        self._unique_id = "refresh_duration"
+
+    # ------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name."""
+        return self._name
+
+    # ------------------------------------------------------
+    @property
+    def native_value(self) -> float | None:
+        """Native value."""
+
+        if (duration := self.component_api.metrics.last_refresh_duration) is None:
+            return None
+
+        return round(duration * 1000, 1)
+
+    # ------------------------------------------------------
+    @property
+    def unique_id(self) -> str:
+        """Unique id."""
+        return self._unique_id
+
+
+# ------------------------------------------------------
+# ------------------------------------------------------
+class LottoLastScrapeSensor(ComponentEntity, SensorEntity):
+    """Diagnostic sensor with the time of the last successful scrape."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    # ------------------------------------------------------
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: CommonConfigEntry,
+    ) -> None:
+        """Last scrape sensor."""
+        super().__init__(entry.runtime_data.coordinator, entry)
+
+        self.hass: HomeAssistant = hass
+        self.component_api = entry.runtime_data.component_api
+        self._name = "Last successful scrape"
+        self._unique_id = "last_successful_scrape"
+
+    # ------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name."""
+        return self._name
+
+    # ------------------------------------------------------
+    @property
+    def native_value(self) -> datetime | None:
+        """Native value."""
+        return self.component_api.metrics.last_success()
+
+    # ------------------------------------------------------
+    @property
+    def unique_id(self) -> str:
+        """Unique id."""
+        return self._unique_id
@@ -0,0 +1,238 @@
+"""Price pool sources."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable, Mapping
+from functools import reduce
+import html
+import importlib
+import operator
+import re
+from time import perf_counter
+from types import ModuleType
+from typing import Any
+
+from aiohttp.client import ClientResponse
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.json import json_loads
+
+from .const import SOURCE_EMBEDDED_JSON, SOURCE_JSON, SOURCE_TITLE
+from .metrics import GameMetrics
+
+_TITLE_END = b"</title>"
+_TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_STREAM_CHUNK_SIZE = 4096
+
+
+# ------------------------------------------------------------------
+def compile_lookup(path: str) -> Callable[[Any], Any]:
+    """Compile a dotted path like "data.games.0.jackpot" into one lookup."""
+
+    if not path:
+        return lambda data: data
+
+    keys: tuple[str | int, ...] = tuple(
+        int(key) if key.isdigit() else key for key in path.split(".")
+    )
+    return lambda data: reduce(operator.getitem, keys, data)
+
+
+# ------------------------------------------------------------------
+def _parse_title(bs4: ModuleType, body: bytes) -> str:
+    """Parse the page title with the full-tree parser, run in the executor."""
+
+    return bs4.BeautifulSoup(body, "lxml").title.text
+
+
+# ------------------------------------------------------------------
+def _to_price_pool(value: Any) -> int:
+    """Convert a price pool value to int."""
+
+    if isinstance(value, str):
+        return int(value.replace(".", ""))
+
+    return int(value)
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class PricePoolSource(ABC):
+    """Base class for price pool sources."""
+
+    name: str
+
+    def __init__(self, hass: HomeAssistant, urls: Mapping[Hashable, str]) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.urls: Mapping[Hashable, str] = urls
+
+    # ------------------------------------------------------------------
+    def url(self, key: Hashable) -> str | None:
+        """Return url for key, None if the source does not cover it."""
+
+        return self.urls.get(key)
+
+    # ------------------------------------------------------------------
+    @abstractmethod
+    async def async_read(self, response: ClientResponse, metrics: GameMetrics) -> int:
+        """Read price pool from response."""
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class JsonSource(PricePoolSource):
+    """Price pool from a lightweight JSON endpoint."""
+
+    name = SOURCE_JSON
+
+    def __init__(
+        self, hass: HomeAssistant, urls: Mapping[Hashable, str], path: str
+    ) -> None:
+        """Init."""
+
+        super().__init__(hass, urls)
+        self._lookup: Callable[[Any], Any] = compile_lookup(path)
+
+    # ------------------------------------------------------------------
+    async def async_read(self, response: ClientResponse, metrics: GameMetrics) -> int:
+        """Read price pool from response."""
+
+        body: bytes = await response.read()
+        metrics.bytes_received += len(body)
+
+        start: float = perf_counter()
+        pool: int = _to_price_pool(self._lookup(json_loads(body)))
+        metrics.last_parse_time = perf_counter() - start
+        return pool
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class EmbeddedJsonSource(PricePoolSource):
+    """Price pool from a JSON script block embedded in the page."""
+
+    name = SOURCE_EMBEDDED_JSON
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        urls: Mapping[Hashable, str],
+        path: str,
+        script_id: str = "__NEXT_DATA__",
+    ) -> None:
+        """Init."""
+
+        super().__init__(hass, urls)
+        self._lookup: Callable[[Any], Any] = compile_lookup(path)
+        self._script_re: re.Pattern[bytes] = re.compile(
+            rb"<script[^>]*\bid=[\"']"
+            + re.escape(script_id.encode())
+            + rb"[\"'][^>]*>(.*?)</script>",
+            re.IGNORECASE | re.DOTALL,
+        )
+
+    # ------------------------------------------------------------------
+    async def async_read(self, response: ClientResponse, metrics: GameMetrics) -> int:
+        """Read price pool from response."""
+
+        body: bytes = await response.read()
+        metrics.bytes_received += len(body)
+
+        start: float = perf_counter()
+
+        if (match := self._script_re.search(body)) is None:
+            raise ValueError("Embedded JSON not found")
+
+        pool: int = _to_price_pool(self._lookup(json_loads(match.group(1))))
+        metrics.last_parse_time = perf_counter() - start
+        return pool
+
+
+# ------------------------------------------------------------------
+# ------------------------------------------------------------------
+class TitleSource(PricePoolSource):
+    """Price pool from the title of the game page."""
+
+    name = SOURCE_TITLE
+
+    def __init__(
+        self, hass: HomeAssistant, urls: Mapping[Hashable, str], stream: bool = True
+    ) -> None:
+        """Init."""
+
+        super().__init__(hass, urls)
+        self.stream: bool = stream
+
+    # ------------------------------------------------------------------
+    async def async_read(self, response: ClientResponse, metrics: GameMetrics) -> int:
+        """Read price pool from response."""
+
+        if self.stream:
+            title, body = await self._async_read_title(response)
+            metrics.bytes_received += len(body)
+
+            if title is not None:
+                start: float = perf_counter()
+                pool: int = self._parse_price_pool(title)
+                metrics.last_parse_time = perf_counter() - start
+                return pool
+        else:
+            body = await response.read()
+            metrics.bytes_received += len(body)
+
+        # bs4 and lxml are only loaded when the fast title extraction fails
+        bs4: ModuleType = await self.hass.async_add_import_executor_job(
+            importlib.import_module, "bs4"
+        )
+
+        start = perf_counter()
+        title = await self.hass.async_add_executor_job(_parse_title, bs4, body)
+        pool = self._parse_price_pool(title)
+        metrics.last_parse_time = perf_counter() - start
+        return pool
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    async def _async_read_title(
+        response: ClientResponse,
+    ) -> tuple[str | None, bytes]:
+        """Read the response until the title is complete.
+
+        The connection is closed as soon as </title> has arrived. If the page
+        has no title the whole body is returned for the full parser.
+        """
+
+        buffer: bytearray = bytearray()
+
+        async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+            start: int = max(0, len(buffer) - len(_TITLE_END))
+            buffer += chunk
+
+            if bytes(buffer[start:]).lower().find(_TITLE_END) == -1:
+                continue
+
+            response.close()
+
+            if (match := _TITLE_RE.search(buffer)) is None:
+                break
+
+            return (
+                html.unescape(
+                    match.group(1).decode(
+                        response.charset or "utf-8",
+                        errors="replace",
+                    )
+                ),
+                bytes(buffer),
+            )
+
+        response.release()
+        return None, bytes(buffer)
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _parse_price_pool(title: str) -> int:
+        """Parse price pool from the page title."""
+
+        return int(title.split()[4].replace(".", ""))
@@ -0,0 +1,139 @@
+"""Bulk import of price pool history into long-term statistics."""
+
+from __future__ import annotations
+
+import csv
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN
+
+STATISTICS_BATCH_SIZE = 1000
+# Same unit as the price pool sensors, so the series can be compared
+STATISTICS_UNIT = "mio"
+
+
+# ------------------------------------------------------------------
+def statistic_id(game: str) -> str:
+    """Return external statistic id for game."""
+
+    return f"{DOMAIN}:{game}_price_pool"
+
+
+# ------------------------------------------------------------------
+def _read_archive(path: Path) -> list[dict[str, Any]]:
+    """Read rows with game, time and price_pool from a CSV or JSON archive."""
+
+    if path.suffix.lower() == ".json":
+        rows = json_loads(path.read_bytes())
+
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("the JSON archive is not a list of objects")
+
+        return rows
+
+    with path.open(newline="", encoding="utf-8") as file:
+        return list(csv.DictReader(file))
+
+
+# ------------------------------------------------------------------
+def _series_from_rows(
+    rows: list[dict[str, Any]], games: set[str]
+) -> dict[str, dict[datetime, float]]:
+    """Group rows into hourly series per game, the last value in an hour wins.
+
+    The price pools are converted from kr to the mio of the sensors.
+    """
+
+    series: dict[str, dict[datetime, float]] = {}
+
+    for row in rows:
+        if (game := str(row["game"]).lower()) not in games:
+            raise HomeAssistantError(f"Unknown game '{row['game']}' in archive")
+
+        if (time := dt_util.parse_datetime(str(row["time"]))) is None:
+            raise HomeAssistantError(f"Invalid time '{row['time']}' in archive")
+
+        if time.tzinfo is None:
+            time = time.replace(tzinfo=dt_util.get_default_time_zone())
+
+        start: datetime = dt_util.as_utc(time).replace(
+            minute=0, second=0, microsecond=0
+        )
+        series.setdefault(game, {})[start] = float(row["price_pool"]) / 1000000
+
+    return series
+
+
+# ------------------------------------------------------------------
+async def async_import_statistics(
+    hass: HomeAssistant, file: str, games: dict[str, str]
+) -> dict[str, int]:
+    """Import an archive of price pools as external statistics.
+
+    games maps the game key to its display name. Statistics are written in
+    batches of STATISTICS_BATCH_SIZE hours.
+
+    Returns:
+        dict[str, int]: Number of imported hours per game
+
+    """
+
+    # Imported here, the recorder is only needed when importing
+    from homeassistant.components.recorder.models import (  # noqa: PLC0415
+        StatisticData,
+        StatisticMeanType,
+        StatisticMetaData,
+    )
+    from homeassistant.components.recorder.statistics import (  # noqa: PLC0415
+        async_add_external_statistics,
+    )
+
+    path: Path = Path(file)
+
+    if not hass.config.is_allowed_path(str(path)):
+        raise HomeAssistantError(f"Access to '{file}' is not allowed")
+
+    try:
+        rows: list[dict[str, Any]] = await hass.async_add_executor_job(
+            _read_archive, path
+        )
+    except (OSError, ValueError) as err:
+        raise HomeAssistantError(f"Could not read '{file}': {err}") from err
+
+    try:
+        series = _series_from_rows(rows, set(games))
+    except (KeyError, TypeError, ValueError) as err:
+        raise HomeAssistantError(f"Invalid row in '{file}': {err}") from err
+
+    imported: dict[str, int] = {}
+
+    for game, values in series.items():
+        metadata = StatisticMetaData(
+            mean_type=StatisticMeanType.ARITHMETIC,
+            has_sum=False,
+            name=f"{games[game]} price pool",
+            source=DOMAIN,
+            statistic_id=statistic_id(game),
+            unit_class=None,
+            unit_of_measurement=STATISTICS_UNIT,
+        )
+        statistics: list[StatisticData] = [
+            StatisticData(start=start, mean=value, min=value, max=value)
+            for start, value in sorted(values.items())
+        ]
+
+        for index in range(0, len(statistics), STATISTICS_BATCH_SIZE):
+            async_add_external_statistics(
+                hass, metadata, statistics[index : index + STATISTICS_BATCH_SIZE]
+            )
+
+        imported[game] = len(statistics)
+
+    return imported
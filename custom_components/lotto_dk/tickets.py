@@ -0,0 +1,233 @@
+"""Checking of ticket rows against a draw result."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .games import GameRules
+from .results import DrawResult
+
+
+# ------------------------------------------------------------------
+def number_mask(numbers: Iterable[int]) -> int:
+    """Return numbers as a bitmask, bit n set for number n."""
+
+    mask: int = 0
+
+    for number in numbers:
+        mask |= 1 << number
+
+    return mask
+
+
+# ------------------------------------------------------------------
+@cache
+def _number_bits(max_number: int) -> dict[str, int]:
+    """Return the bit of each number 1..max_number by its text, also 0 padded."""
+
+    bits: dict[str, int] = {}
+
+    for number in range(1, max_number + 1):
+        bits[str(number)] = bits[f"{number:02d}"] = 1 << number
+
+    return bits
+
+
+# ------------------------------------------------------------------
+def parse_row(text: str, rules: GameRules) -> tuple[int, int]:
+    """Parse a row like "3 12 17 28 44 + 2 9" into number and extra masks.
+
+    The masks are summed from a lookup of the number texts. Duplicates carry
+    into fewer set bits, so a count check of the mask finds them.
+
+    Raises:
+        ValueError: If the row does not follow the rules of the game
+
+    """
+
+    numbers, _, extra_numbers = text.partition("+")
+    tokens: list[str] = numbers.replace(",", " ").split()
+    extra_tokens: list[str] = extra_numbers.replace(",", " ").split()
+    row_extras: int = 0 if rules.extra_from_main else rules.extra_numbers
+
+    try:
+        mask: int = sum(map(_number_bits(rules.max_number).__getitem__, tokens))
+        extra_mask: int = sum(
+            map(_number_bits(rules.max_extra).__getitem__, extra_tokens)
+        )
+    except KeyError as err:
+        raise ValueError(f"number {err} out of range in '{text.strip()}'") from err
+
+    if (
+        len(tokens) != rules.numbers
+        or mask.bit_count() != rules.numbers
+        or len(extra_tokens) != row_extras
+        or extra_mask.bit_count() != row_extras
+    ):
+        raise ValueError(
+            f"expected {rules.numbers} + {row_extras} different numbers"
+            f" in '{text.strip()}'"
+        )
+
+    return mask, extra_mask
+
+
+# ------------------------------------------------------------------
+def drawn_result(
+    rules: GameRules, draw_date: date, numbers: list[int], extra_numbers: list[int]
+) -> DrawResult:
+    """Return a draw result from drawn numbers given by hand.
+
+    Raises:
+        ValueError: If the drawn numbers do not follow the rules of the game
+
+    """
+
+    max_extra: int = rules.max_number if rules.extra_from_main else rules.max_extra
+
+    for drawn, required, max_number in (
+        (numbers, rules.numbers, rules.max_number),
+        (extra_numbers, rules.extra_numbers, max_extra),
+    ):
+        if len(set(drawn)) != len(drawn) or len(drawn) != required:
+            raise ValueError(f"expected {required} different numbers, got {drawn}")
+
+        if drawn and not 1 <= min(drawn) <= max(drawn) <= max_number:
+            raise ValueError(f"number out of range in {drawn}")
+
+    if rules.extra_from_main and set(numbers) & set(extra_numbers):
+        raise ValueError("the extra numbers are drawn after the numbers")
+
+    return DrawResult(draw_date, tuple(sorted(numbers)), tuple(sorted(extra_numbers)))
+
+
+# ------------------------------------------------------------------
+@cache
+def tier_table(rules: GameRules) -> tuple[str | None, ...]:
+    """Return the prize tier indexed by main hits * width + extra hits.
+
+    The width is extra_numbers + 1. Built once per game.
+    """
+
+    width: int = rules.extra_numbers + 1
+    table: list[str | None] = [None] * ((rules.numbers + 1) * width)
+
+    for name, main_hits, extra_hits in rules.tiers:
+        for hits in range(width) if extra_hits is None else (extra_hits,):
+            if table[main_hits * width + hits] is None:
+                table[main_hits * width + hits] = name
+
+    return tuple(table)
+
+
+# ------------------------------------------------------------------
+def check_rows(
+    rows: list[tuple[int, str]], rules: GameRules, result: DrawResult
+) -> dict[str, Any]:
+    """Score numbered rows against a draw result in one bitmask pass.
+
+    Raises:
+        ValueError: If a row does not follow the rules of the game
+
+    """
+
+    masks: list[int] = []
+    extra_masks: list[int] = []
+
+    for row, text in rows:
+        try:
+            mask, extra_mask = parse_row(text, rules)
+        except ValueError as err:
+            raise ValueError(f"row {row}: {err}") from err
+
+        masks.append(mask)
+        extra_masks.append(extra_mask)
+
+    draw_mask: int = number_mask(result.numbers)
+    draw_extra_mask: int = number_mask(result.extra_numbers)
+    width: int = rules.extra_numbers + 1
+    table: tuple[str | None, ...] = tier_table(rules)
+
+    tiers: list[str | None] = [
+        table[main_hits * width + extra_hits]
+        for main_hits, extra_hits in zip(
+            map(int.bit_count, map(draw_mask.__and__, masks)),
+            map(
+                int.bit_count,
+                map(
+                    draw_extra_mask.__and__,
+                    masks if rules.extra_from_main else extra_masks,
+                ),
+            ),
+            strict=True,
+        )
+    ]
+    counts: Counter[str | None] = Counter(tiers)
+
+    return {
+        "draw_date": result.draw_date.isoformat(),
+        "rows": len(rows),
+        "tiers": {name: counts[name] for name, _, _ in rules.tiers},
+        "winning_rows": [
+            {"row": row, "numbers": text.strip(), "tier": tier}
+            for (row, text), tier in zip(rows, tiers, strict=True)
+            if tier is not None
+        ],
+    }
+
+
+# ------------------------------------------------------------------
+def _read_rows(path: Path) -> list[tuple[int, str]]:
+    """Read rows from a file, one per line. Empty and # lines are skipped."""
+
+    with path.open(encoding="utf-8") as file:
+        return [
+            (line_number, line)
+            for line_number, line in enumerate(file, 1)
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+
+# ------------------------------------------------------------------
+def _check_file(path: Path, rules: GameRules, result: DrawResult) -> dict[str, Any]:
+    """Read and check the rows of a file, run in the executor."""
+
+    return check_rows(_read_rows(path), rules, result)
+
+
+# ------------------------------------------------------------------
+async def async_check_tickets(
+    hass: HomeAssistant,
+    rules: GameRules,
+    result: DrawResult,
+    rows: list[str] | None,
+    file: str | None,
+) -> dict[str, Any]:
+    """Check inline rows or the rows of a local file against a draw result.
+
+    Parsing and scoring run in the executor, large batches do not block the
+    event loop. Rows are numbered by position or line number.
+    """
+
+    try:
+        if file is None:
+            return await hass.async_add_executor_job(
+                check_rows, list(enumerate(rows or [], 1)), rules, result
+            )
+
+        if not hass.config.is_allowed_path(file):
+            raise HomeAssistantError(f"Access to '{file}' is not allowed")
+
+        return await hass.async_add_executor_job(_check_file, Path(file), rules, result)
+    except OSError as err:
+        raise HomeAssistantError(f"Could not read '{file}': {err}") from err
+    except ValueError as err:
+        raise HomeAssistantError(f"Invalid {err}") from err
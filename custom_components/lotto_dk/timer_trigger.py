@@ -1,15 +1,23 @@
 """Timer trigger class."""
 
+import asyncio
 from datetime import datetime, timedelta
 from enum import Enum
 import inspect
+import time
 
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import Event, State, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import start
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_state_change_event,
+)
 from homeassistant.util import Callable, dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
 
 # ------------------------------------------------------
 # ------------------------------------------------------
@@ -29,13 +37,90 @@ class TimerTriggerErrorEnum(Enum):
         return self != TimerTriggerErrorEnum.NONE
 
 
+# ------------------------------------------------------
+# ------------------------------------------------------
+class _TimerFinishedDispatcher:
+    """Shared timer.finished listener dispatching to registered triggers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init."""
+
+        self.hass: HomeAssistant = hass
+        self.triggers: dict[str, list[TimerTrigger]] = {}
+        self.unsub_listen: Callable[[], None] | None = None
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> "_TimerFinishedDispatcher":
+        """Get the dispatcher for hass."""
+
+        if (dispatcher := hass.data.get(_DISPATCHER_KEY)) is None:
+            dispatcher = hass.data[_DISPATCHER_KEY] = cls(hass)
+
+        return dispatcher
+
+    # ------------------------------------------------------------------
+    @callback
+    def async_register(self, trigger: "TimerTrigger") -> Callable[[], None]:
+        """Register trigger for its timer entity."""
+
+        self.triggers.setdefault(trigger.timer_entity, []).append(trigger)
+
+        if self.unsub_listen is None:
+            self.unsub_listen = self.hass.bus.async_listen(
+                "timer.finished",
+                self.async_handle_timer_finished,
+                event_filter=self._async_filter_timer_finished,
+            )
+
+        @callback
+        def async_unregister() -> None:
+            """Unregister trigger."""
+
+            triggers: list[TimerTrigger] = self.triggers.get(trigger.timer_entity, [])
+
+            if trigger in triggers:
+                triggers.remove(trigger)
+
+            if not triggers:
+                self.triggers.pop(trigger.timer_entity, None)
+
+            if not self.triggers and self.unsub_listen is not None:
+                self.unsub_listen()
+                self.unsub_listen = None
+
+        return async_unregister
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_filter_timer_finished(self, event_data: dict) -> bool:
+        """Only pass events for registered timer entities."""
+
+        return event_data.get(ATTR_ENTITY_ID) in self.triggers
+
+    # ------------------------------------------------------------------
+    async def async_handle_timer_finished(self, event: Event) -> None:
+        """Dispatch timer finished to the triggers of the timer entity."""
+
+        for trigger in list(self.triggers.get(event.data[ATTR_ENTITY_ID], ())):
+            await trigger.async_handle_timer_finished(event)
+
+
+# Namespaced, the module is shared by several integrations
+_DISPATCHER_KEY: HassKey[_TimerFinishedDispatcher] = HassKey(
+    f"{DOMAIN}_timer_trigger_dispatcher"
+)
+# Restart lock and number of users per timer entity
+_TIMER_LOCKS_KEY: HassKey[dict[str, tuple[asyncio.Lock, int]]] = HassKey(
+    f"{DOMAIN}_timer_trigger_locks"
+)
+
+
 # ------------------------------------------------------
 # ------------------------------------------------------
 class TimerTrigger:
     """Timer trigger class."""
 
-    restarting_timer: bool = False
-
     def __init__(
         self,
         entity: Entity,
@@ -43,8 +128,18 @@ class TimerTrigger:
         duration: timedelta | None = None,
         callback_trigger: Callable[[TimerTriggerErrorEnum], None] = None,
         auto_restart: bool = True,
+        coalesce_window: timedelta | None = None,
+        coalesce_leading: bool = True,
+        restart_blocking: bool = False,
+        callback_recovered: Callable[[], None] | None = None,
     ) -> None:
-        """Init."""
+        """Init.
+
+        Triggers arriving inside coalesce_window are coalesced into one
+        callback run, on the leading or trailing edge of the window. A trigger
+        arriving while the callback is running reuses that run.
+        callback_recovered is called when a missing timer entity reappears.
+        """
 
         if (timer_entity == "" and duration is None) or (
             timer_entity == ""
@@ -62,15 +157,30 @@ class TimerTrigger:
         self.callback_trigger: Callable[[TimerTriggerErrorEnum], None] | None = (
             callback_trigger
         )
+        self.callback_recovered: Callable[[], None] | None = callback_recovered
         self.auto_restart: bool = auto_restart
+        self.restart_blocking: bool = restart_blocking
+        self.coalesce_window: float = (
+            coalesce_window.total_seconds() if coalesce_window is not None else 0
+        )
+        self.coalesce_leading: bool = coalesce_leading
+        self._callback_is_coroutine: bool = inspect.iscoroutinefunction(
+            callback_trigger
+        )
+        self._callback_task: asyncio.Task | None = None
+        self._callback_last_run: float | None = None
 
         self.error: TimerTriggerErrorEnum = TimerTriggerErrorEnum.NONE
         self.timer_state: State
         self.unsub_async_track_point_in_utc_time: Callable[[], None] | None = None
+        self.unsub_dispatcher: Callable[[], None] | None = None
+        self.unsub_track_timer_reappear: Callable[[], None] | None = None
 
         self.entity.async_on_remove(
             start.async_at_started(self.entity.hass, self.async_hass_started)
         )
+        self.entity.async_on_remove(self.point_in_time_listener_stop)
+        self.entity.async_on_remove(self._async_unsubscribe)
 
     # ------------------------------------------------------------------
     async def async_validate_timer(self) -> bool:
@@ -80,41 +190,153 @@ class TimerTrigger:
 
         if state is None:
             self.error = TimerTriggerErrorEnum.MISSING_TIMER_ENTITY
-
-            if inspect.iscoroutinefunction(self.callback_trigger):
-                await self.callback_trigger(self.error)
-            else:
-                self.callback_trigger(self.error)
-
+            self._async_track_timer_reappear()
+            await self._async_run_callback()
             return False
 
         return True
 
+    # ------------------------------------------------------------------
+    @callback
+    def _async_track_timer_reappear(self) -> None:
+        """Track the missing timer entity to recover when it reappears."""
+
+        if self.unsub_track_timer_reappear is not None:
+            return
+
+        self.unsub_track_timer_reappear = async_track_state_change_event(
+            self.entity.hass, [self.timer_entity], self._async_timer_state_changed
+        )
+
+    # ------------------------------------------------------------------
+    async def _async_timer_state_changed(self, event: Event) -> None:
+        """Handle state change of the missing timer entity."""
+
+        if event.data["new_state"] is None:
+            return
+
+        if self.unsub_track_timer_reappear is not None:
+            self.unsub_track_timer_reappear()
+            self.unsub_track_timer_reappear = None
+
+        self.error = TimerTriggerErrorEnum.NONE
+
+        if self.callback_recovered is not None:
+            self.callback_recovered()
+
+        await self.async_hass_started(None)
+
+    # ------------------------------------------------------------------
+    @callback
+    def _async_unsubscribe(self) -> None:
+        """Unsubscribe listeners on entity removal."""
+
+        if self.unsub_dispatcher is not None:
+            self.unsub_dispatcher()
+            self.unsub_dispatcher = None
+
+        if self.unsub_track_timer_reappear is not None:
+            self.unsub_track_timer_reappear()
+            self.unsub_track_timer_reappear = None
+
+    # ------------------------------------------------------------------
+    async def _async_run_callback(self) -> None:
+        """Run callback."""
+
+        if self._callback_is_coroutine:
+            await self.callback_trigger(self.error)
+        else:
+            self.callback_trigger(self.error)
+
+    # ------------------------------------------------------------------
+    async def _async_run_callback_trailing(self) -> None:
+        """Run callback at the end of the coalesce window."""
+
+        await asyncio.sleep(self.coalesce_window)
+        await self._async_run_callback()
+
+    # ------------------------------------------------------------------
+    async def async_call_callback(self) -> None:
+        """Call callback, coalescing calls inside the coalesce window."""
+
+        if self._callback_task is None or self._callback_task.done():
+            now: float = time.monotonic()
+
+            if not self.coalesce_leading and self.coalesce_window > 0:
+                self._callback_task = self.entity.hass.async_create_task(
+                    self._async_run_callback_trailing()
+                )
+            elif (
+                self._callback_last_run is not None
+                and now - self._callback_last_run < self.coalesce_window
+            ):
+                return
+            else:
+                self._callback_last_run = now
+                self._callback_task = self.entity.hass.async_create_task(
+                    self._async_run_callback()
+                )
+
+        await asyncio.shield(self._callback_task)
+
     # ------------------------------------------------------------------
     async def async_restart_timer(self) -> bool:
-        """Restart timer."""
+        """Restart timer.
+
+        With restart_blocking False the restart runs as a background task, so
+        a slow timer.start never stalls the caller.
+        """
 
         if self.error:
             return False
 
-        state: State = self.entity.hass.states.get(self.timer_entity)
+        if not self.auto_restart:
+            return True
 
-        if (
-            state.state == "idle"
-            and not TimerTrigger.restarting_timer
-            and self.auto_restart
-        ):
-            TimerTrigger.restarting_timer = True
-
-            await self.entity.hass.services.async_call(
-                "timer",
-                "start",
-                service_data={ATTR_ENTITY_ID: self.timer_entity},
-                blocking=True,
+        if self.restart_blocking:
+            await self._async_restart_timer()
+        else:
+            self.entity.hass.async_create_background_task(
+                self._async_restart_timer(),
+                f"timer_trigger restart {self.timer_entity}",
             )
-            TimerTrigger.restarting_timer = False
         return True
 
+    # ------------------------------------------------------------------
+    async def _async_restart_timer(self) -> None:
+        """Start the timer if idle, serialized per timer entity.
+
+        The locks are kept per hass instance and removed again when their
+        last user is done.
+        """
+
+        locks: dict[str, tuple[asyncio.Lock, int]] = self.entity.hass.data.setdefault(
+            _TIMER_LOCKS_KEY, {}
+        )
+        lock, users = locks.get(self.timer_entity, (asyncio.Lock(), 0))
+        locks[self.timer_entity] = (lock, users + 1)
+
+        try:
+            async with lock:
+                state: State | None = self.entity.hass.states.get(self.timer_entity)
+
+                if state is None or state.state != "idle":
+                    return
+
+                await self.entity.hass.services.async_call(
+                    "timer",
+                    "start",
+                    service_data={ATTR_ENTITY_ID: self.timer_entity},
+                    blocking=True,
+                )
+        finally:
+            lock, users = locks[self.timer_entity]
+
+            if users == 1:
+                del locks[self.timer_entity]
+            else:
+                locks[self.timer_entity] = (lock, users - 1)
+
     # ------------------------------------------------------------------
     async def async_point_in_time_listener(self, time_date: datetime) -> None:
         """Point in time listener."""
@@ -122,17 +344,21 @@ class TimerTrigger:
         if self.error:
             return
 
-        if self.unsub_async_track_point_in_utc_time:
-            self.unsub_async_track_point_in_utc_time()
-            self.unsub_async_track_point_in_utc_time = None
+        self.point_in_time_listener_stop()
 
-        if inspect.iscoroutinefunction(self.callback_trigger):
-            await self.callback_trigger(self.error)
-        else:
-            self.callback_trigger(self.error)
+        await self.async_call_callback()
 
         self.point_in_time_listener_start()
 
+    # ------------------------------------------------------------------
+    @callback
+    def point_in_time_listener_stop(self) -> None:
+        """Point in time listener stop."""
+
+        if self.unsub_async_track_point_in_utc_time:
+            self.unsub_async_track_point_in_utc_time()
+            self.unsub_async_track_point_in_utc_time = None
+
     # ------------------------------------------------------------------
     def point_in_time_listener_start(self) -> None:
         """Point in time listener start."""
@@ -146,16 +372,12 @@ class TimerTrigger:
         )
 
     # ------------------------------------------------------------------
-    @callback
     async def async_handle_timer_finished(self, event: Event) -> None:
-        """Handle timer finished."""
+        """Handle timer finished for the timer entity."""
 
-        if inspect.iscoroutinefunction(self.callback_trigger):
-            await self.callback_trigger(self.error)
-        else:
-            self.callback_trigger(self.error)
+        await self.async_call_callback()
 
-        if not self.error and event.data[ATTR_ENTITY_ID] == self.timer_entity:
+        if not self.error:
             if self.auto_restart:
                 if await self.async_validate_timer():
                     await self.async_restart_timer()
@@ -166,11 +388,10 @@ class TimerTrigger:
 
         if self.timer_entity != "":
             if await self.async_validate_timer():
-                self.entity.async_on_remove(
-                    self.entity.hass.bus.async_listen(
-                        "timer.finished", self.async_handle_timer_finished
-                    )
-                )
+                if self.unsub_dispatcher is None:
+                    self.unsub_dispatcher = _TimerFinishedDispatcher.get(
+                        self.entity.hass
+                    ).async_register(self)
 
                 if self.auto_restart:
                     await self.async_restart_timer()
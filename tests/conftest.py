@@ -0,0 +1,203 @@
+"""Fixtures for the Lotto DK tests.
+
+danskespil.dk is not called from the tests. A local stand-in server serves
+the game pages and a JSON endpoint from tests/fixtures. The pages are
+stand-ins, not recordings: they keep the title format of the real pages,
+with the price pool as the fifth word, and the embedded JSON. The body is
+padded to the size of a real game page.
+"""
+
+from collections.abc import AsyncGenerator, Generator
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aiohttp.typedefs import Handler
+import pytest
+from yarl import URL
+
+from custom_components.lotto_dk.component_api import ComponentApi
+from custom_components.lotto_dk.const import (
+    CONF_RESULT_PATH,
+    CONF_RESULT_URL,
+    CONF_SOURCE,
+    CONF_SOURCE_PATH,
+    CONF_SOURCE_URL,
+    DOMAIN,
+    LOGGER,
+    SOURCE_TITLE,
+)
+from custom_components.lotto_dk.games import GAMES
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Size of a danskespil.dk game page, the padding comes before the embedded JSON
+PAGE_SIZE = 250 * 1024
+PAGE_PADDING_MARKER = b"<!-- content -->"
+PAGE_PADDING_BLOCK = b'<div class="tile"><a href="/spil">Spil nu</a></div>\n'
+
+JSON_PATH = "/api/jackpot/{game}"
+RESULT_PATH = "/api/result/{game}"
+
+# Price pools of the fixtures
+POOLS: dict[str, int] = {
+    "euro_jackpot": 550000000,
+    "lotto": 35000000,
+    "viking_lotto": 49000000,
+}
+
+# A Wednesday noon without a draw or a due scrape in the following hour, after
+# the draws of the result fixtures
+QUIET_HOUR = datetime(2026, 10, 14, 12, 0, tzinfo=dt_util.UTC)
+
+
+# ------------------------------------------------------------------
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option to run the benchmarks."""
+
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run the benchmarks marked with benchmark",
+    )
+
+
+# ------------------------------------------------------------------
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip the benchmarks unless --benchmark is given."""
+
+    if config.getoption("--benchmark"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="needs --benchmark to run")
+
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+# ------------------------------------------------------------------
+def load_page(name: str) -> bytes:
+    """Load a fixture page and pad its body to PAGE_SIZE."""
+
+    page: bytes = (FIXTURES / f"{name}.html").read_bytes()
+    blocks: int = (PAGE_SIZE - len(page)) // len(PAGE_PADDING_BLOCK)
+    return page.replace(
+        PAGE_PADDING_MARKER, PAGE_PADDING_MARKER + PAGE_PADDING_BLOCK * blocks
+    )
+
+
+# ------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable the custom integration in all tests."""
+
+
+# ------------------------------------------------------------------
+@pytest.fixture
+async def stand_in_server(socket_enabled: None) -> AsyncGenerator[TestServer]:
+    """Serve the fixture pages and the JSON endpoint like danskespil.dk.
+
+    The test plugin blocks sockets, they are enabled for the local server.
+    """
+
+    pages: dict[str, bytes] = {
+        URL(game.url).path: load_page(URL(game.url).path.strip("/"))
+        for game in GAMES.values()
+    }
+
+    async def handle_page(request: web.Request) -> web.Response:
+        if (page := pages.get(request.path)) is None:
+            raise web.HTTPNotFound
+
+        return web.Response(body=page, content_type="text/html", charset="utf-8")
+
+    def json_handler(prefix: str) -> Handler:
+        async def handle_json(request: web.Request) -> web.Response:
+            path: Path = FIXTURES / f"{prefix}{request.match_info['game']}.json"
+
+            if not path.is_file():
+                raise web.HTTPNotFound
+
+            return web.Response(body=path.read_bytes(), content_type="application/json")
+
+        return handle_json
+
+    app: web.Application = web.Application()
+    app.router.add_get(JSON_PATH, json_handler(""))
+    app.router.add_get(RESULT_PATH, json_handler("result_"))
+    app.router.add_get("/{page}", handle_page)
+
+    server: TestServer = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+# ------------------------------------------------------------------
+@pytest.fixture
+def stand_in_games(stand_in_server: TestServer) -> Generator[None]:
+    """Point the game pages of the registry at the stand-in server."""
+
+    with patch.dict(
+        GAMES,
+        {
+            lotto_type: replace(
+                game, url=str(stand_in_server.make_url(URL(game.url).path))
+            )
+            for lotto_type, game in GAMES.items()
+        },
+    ):
+        yield
+
+
+# ------------------------------------------------------------------
+def stand_in_options(
+    server: TestServer,
+    source: str = SOURCE_TITLE,
+    path: str = "",
+    results: bool = False,
+) -> dict[str, object]:
+    """Return options with all games selected and the sources of the server."""
+
+    base_url: str = str(server.make_url("/")).rstrip("/")
+    options: dict[str, object] = {
+        **{game.conf_key: True for game in GAMES.values()},
+        CONF_SOURCE: source,
+        CONF_SOURCE_URL: base_url + JSON_PATH,
+        CONF_SOURCE_PATH: path,
+    }
+
+    if results:
+        options[CONF_RESULT_URL] = base_url + RESULT_PATH
+        options[CONF_RESULT_PATH] = "data.result"
+
+    return options
+
+
+# ------------------------------------------------------------------
+@pytest.fixture
+async def component_api(
+    hass: HomeAssistant, stand_in_server: TestServer, stand_in_games: None
+) -> ComponentApi:
+    """Return a component api with the game pages on the stand-in server."""
+
+    api: ComponentApi = ComponentApi(
+        hass,
+        DataUpdateCoordinator(hass, LOGGER, name=DOMAIN),
+        async_get_clientsession(hass),
+    )
+    api.update_options(stand_in_options(stand_in_server))
+    return api
@@ -0,0 +1,286 @@
+"""Benchmarks of the update path against the stand-in server.
+
+The measurements are compared with tests/benchmark_baseline.json. Counts
+like bytes and state writes may not exceed the baseline, timings may not
+exceed it by more than the tolerance factor. The benchmarks only run with
+--benchmark, add LOTTO_DK_BENCHMARK_UPDATE=1 to write the measurements as
+the new baseline.
+"""
+
+from collections.abc import Generator
+from datetime import timedelta
+import json
+import os
+from pathlib import Path
+from statistics import median
+import subprocess
+import sys
+from typing import Any
+
+from aiohttp.test_utils import TestServer
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.lotto_dk.component_api import ComponentApi
+from custom_components.lotto_dk.const import (
+    DOMAIN,
+    SOURCE_EMBEDDED_JSON,
+    SOURCE_JSON,
+    SOURCE_TITLE,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from custom_components.lotto_dk.games import GAMES, LottoTypes
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .conftest import QUIET_HOUR, stand_in_options
+
+pytestmark = pytest.mark.benchmark
+
+ROOT = Path(__file__).parent.parent
+BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+BASELINE: dict[str, Any] = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+UPDATE_BASELINE: bool = os.environ.get("LOTTO_DK_BENCHMARK_UPDATE") == "1"
+
+# Sections holding counts, compared without tolerance
+COUNTS = ("bytes_received", "state_writes_per_hour")
+ROUNDS = 20
+
+SOURCE_PATHS: dict[str, str] = {
+    SOURCE_TITLE: "",
+    SOURCE_EMBEDDED_JSON: "props.pageProps.jackpot",
+    SOURCE_JSON: "data.jackpot",
+}
+
+
+# ------------------------------------------------------------------
+@pytest.fixture(scope="module")
+def measurements() -> Generator[dict[str, dict[str, float]]]:
+    """Collect the measurements, written as the baseline in update mode."""
+
+    measured: dict[str, dict[str, float]] = {}
+    yield measured
+
+    if UPDATE_BASELINE:
+        baseline: dict[str, Any] = dict(BASELINE)
+
+        for section, values in measured.items():
+            baseline[section] = {**baseline.get(section, {}), **values}
+
+        BASELINE_PATH.write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+
+
+# ------------------------------------------------------------------
+def check_baseline(
+    measured: dict[str, dict[str, float]], section: str, key: str, value: float
+) -> None:
+    """Record a measurement and fail if it regressed from the baseline."""
+
+    measured.setdefault(section, {})[key] = round(value, 3)
+
+    if UPDATE_BASELINE:
+        return
+
+    limit: float = BASELINE[section][key]
+
+    if section not in COUNTS:
+        limit *= BASELINE["tolerance"]
+
+    assert value <= limit, f"{section}[{key}]: {value:.3f} exceeds {limit:.3f}"
+
+
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("source", list(SOURCE_PATHS))
+async def test_price_pool_parse(
+    component_api: ComponentApi,
+    stand_in_server: TestServer,
+    measurements: dict[str, dict[str, float]],
+    source: str,
+) -> None:
+    """Parse latency of _async_get_price_pool and bytes of one update."""
+
+    component_api.update_options(
+        stand_in_options(stand_in_server, source, SOURCE_PATHS[source])
+    )
+    parse_times: list[float] = []
+
+    for _ in range(ROUNDS):
+        assert await component_api._async_get_price_pool(LottoTypes.LOTTO)
+        parse_times.append(component_api.metrics.game("lotto").last_parse_time)
+
+    component_api.metrics.games.clear()
+
+    for lotto_type in GAMES:
+        assert await component_api._async_get_price_pool(lotto_type)
+
+    check_baseline(measurements, "parse_latency_ms", source, median(parse_times) * 1000)
+    check_baseline(
+        measurements,
+        "bytes_received",
+        source,
+        sum(metrics.bytes_received for metrics in component_api.metrics.games.values()),
+    )
+
+
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("games", [1, 2, 3])
+async def test_update(
+    component_api: ComponentApi,
+    stand_in_server: TestServer,
+    measurements: dict[str, dict[str, float]],
+    games: int,
+) -> None:
+    """End-to-end async_update latency with 1 to 3 games due."""
+
+    options: dict[str, object] = stand_in_options(stand_in_server)
+
+    for game in list(GAMES.values())[games:]:
+        options[game.conf_key] = False
+
+    component_api.update_options(options)
+    durations: list[float] = []
+
+    for _ in range(ROUNDS):
+        for lotto_type in component_api.selected:
+            component_api.scrape_scheduler.postpone(lotto_type, dt_util.utcnow())
+
+        await component_api.async_update()
+        durations.append(component_api.metrics.last_refresh_duration)
+
+    assert len(component_api.price_pools) == games
+    check_baseline(
+        measurements, "update_latency_ms", str(games), median(durations) * 1000
+    )
+
+
+# ------------------------------------------------------------------
+async def test_state_writes_per_hour(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    stand_in_server: TestServer,
+    stand_in_games: None,
+    measurements: dict[str, dict[str, float]],
+) -> None:
+    """Entity state writes during an hour of scroll ticks without a timer."""
+
+    freezer.move_to(QUIET_HOUR)
+    entry: MockConfigEntry = MockConfigEntry(
+        domain=DOMAIN, options=stand_in_options(stand_in_server)
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    component_api: ComponentApi = entry.runtime_data.component_api
+    component_api.metrics.state_writes = 0
+
+    for _ in range(60):
+        freezer.tick(timedelta(minutes=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert component_api.metrics.refreshes == 1
+    check_baseline(
+        measurements,
+        "state_writes_per_hour",
+        "scroll",
+        component_api.metrics.state_writes,
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+# ------------------------------------------------------------------
+def test_import_time(measurements: dict[str, dict[str, float]]) -> None:
+    """Import time of the integration modules, without the parser stack.
+
+    Only the self time of the integration modules is counted, Home
+    Assistant itself is left out.
+    """
+
+    process: subprocess.CompletedProcess = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import custom_components.lotto_dk.sensor,"
+            " custom_components.lotto_dk.config_flow",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules: dict[str, int] = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        self_time, _, module = line.removeprefix("import time:").split("|")
+
+        if self_time.strip().isdigit():
+            modules[module.strip()] = int(self_time)
+
+    assert "custom_components.lotto_dk.component_api" in modules
+    assert "bs4" not in modules
+    assert "lxml" not in modules
+
+    check_baseline(
+        measurements,
+        "startup_ms",
+        "import",
+        sum(
+            self_time
+            for module, self_time in modules.items()
+            if module.startswith("custom_components.lotto_dk")
+        )
+        / 1000,
+    )
+
+
+# ------------------------------------------------------------------
+async def test_setup_time(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    stand_in_server: TestServer,
+    stand_in_games: None,
+    measurements: dict[str, dict[str, float]],
+) -> None:
+    """Setup time with stored price pools, the refresh is not waited for."""
+
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            game.unique_id: {"price_pool": 1000000, "fetched": None}
+            for game in GAMES.values()
+        },
+    }
+    entry: MockConfigEntry = MockConfigEntry(
+        domain=DOMAIN, options=stand_in_options(stand_in_server)
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    component_api: ComponentApi = entry.runtime_data.component_api
+
+    check_baseline(
+        measurements, "startup_ms", "setup", component_api.metrics.setup_duration * 1000
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,42 @@
+"""Tests of the diagnostics."""
+
+import json
+from typing import Any
+
+from aiohttp.test_utils import TestServer
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.lotto_dk.const import DOMAIN
+from custom_components.lotto_dk.diagnostics import async_get_config_entry_diagnostics
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
+
+from .conftest import stand_in_options
+
+
+# ------------------------------------------------------------------
+async def test_diagnostics_with_errors(
+    hass: HomeAssistant, stand_in_server: TestServer, stand_in_games: None
+) -> None:
+    """The diagnostics serialize after scrape errors have been counted."""
+
+    entry: MockConfigEntry = MockConfigEntry(
+        domain=DOMAIN, options=stand_in_options(stand_in_server)
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    game_metrics = entry.runtime_data.component_api.metrics.game("lotto")
+    game_metrics.record_error(TimeoutError())
+    game_metrics.record_error(TimeoutError())
+
+    diagnostics: dict[str, Any] = json.loads(
+        json_dumps(await async_get_config_entry_diagnostics(hass, entry))
+    )
+
+    assert diagnostics["metrics"]["games"]["lotto"]["errors"] == {"TimeoutError": 2}
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,106 @@
+"""Tests of the missing timer repair issue."""
+
+from aiohttp.test_utils import TestServer
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.lotto_dk import missing_timer_issue_id
+from custom_components.lotto_dk.const import (
+    CONF_LISTEN_TO_TIMER_TRIGGER,
+    DOMAIN,
+    TRANSLATION_KEY_MISSING_TIMER_ENTITY,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+
+from .conftest import stand_in_options
+
+TIMER_ENTITY = "timer.lotto_scroll"
+
+
+# ------------------------------------------------------------------
+def create_issue(hass: HomeAssistant, issue_id: str) -> None:
+    """Create a missing timer issue."""
+
+    ir.async_create_issue(
+        hass,
+        DOMAIN,
+        issue_id,
+        is_fixable=False,
+        severity=ir.IssueSeverity.WARNING,
+        translation_key=TRANSLATION_KEY_MISSING_TIMER_ENTITY,
+    )
+
+
+# ------------------------------------------------------------------
+async def setup_entry(hass: HomeAssistant, server: TestServer) -> MockConfigEntry:
+    """Set up an entry listening to the missing TIMER_ENTITY."""
+
+    entry: MockConfigEntry = MockConfigEntry(
+        domain=DOMAIN,
+        options={
+            **stand_in_options(server),
+            CONF_LISTEN_TO_TIMER_TRIGGER: TIMER_ENTITY,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+# ------------------------------------------------------------------
+async def test_cleanup_keeps_issues_of_other_entries(
+    hass: HomeAssistant,
+    issue_registry: ir.IssueRegistry,
+    stand_in_server: TestServer,
+    stand_in_games: None,
+) -> None:
+    """Only stale issues of the entry itself and legacy issues are deleted."""
+
+    other_issue_id: str = f"{TRANSLATION_KEY_MISSING_TIMER_ENTITY}_other_timer.a"
+    create_issue(hass, other_issue_id)
+    create_issue(hass, "Lotto DK2024-05-01T10:00:00")
+
+    entry: MockConfigEntry = await setup_entry(hass, stand_in_server)
+    stale_issue_id: str = missing_timer_issue_id(entry).replace(
+        TIMER_ENTITY, "timer.old"
+    )
+    create_issue(hass, stale_issue_id)
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={**entry.options, CONF_LISTEN_TO_TIMER_TRIGGER: "timer.new"},
+    )
+    await hass.async_block_till_done()
+
+    assert set(issue_registry.issues) == {
+        (DOMAIN, other_issue_id),
+        (DOMAIN, missing_timer_issue_id(entry)),
+    }
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+# ------------------------------------------------------------------
+async def test_issue_cleared_when_timer_reappears(
+    hass: HomeAssistant,
+    issue_registry: ir.IssueRegistry,
+    stand_in_server: TestServer,
+    stand_in_games: None,
+) -> None:
+    """The issue of a missing timer is deleted as soon as the timer is back."""
+
+    entry: MockConfigEntry = await setup_entry(hass, stand_in_server)
+    issue_id: str = missing_timer_issue_id(entry)
+
+    assert issue_registry.async_get_issue(DOMAIN, issue_id) is not None
+
+    hass.states.async_set(TIMER_ENTITY, "idle")
+    await hass.async_block_till_done()
+
+    assert issue_registry.async_get_issue(DOMAIN, issue_id) is None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,89 @@
+"""Tests of the draw results and their sensors."""
+
+from aiohttp.test_utils import TestServer
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.lotto_dk.component_api import ComponentApi
+from custom_components.lotto_dk.const import DOMAIN
+from custom_components.lotto_dk.games import GAMES, LottoTypes
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .conftest import QUIET_HOUR, stand_in_options
+
+
+# ------------------------------------------------------------------
+def result_entity_id(hass: HomeAssistant, lotto_type: LottoTypes) -> str | None:
+    """Return the entity id of the result sensor of a game."""
+
+    return er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, GAMES[lotto_type].unique_id + "_result"
+    )
+
+
+# ------------------------------------------------------------------
+async def test_result_sensors_need_a_source(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    stand_in_server: TestServer,
+    stand_in_games: None,
+) -> None:
+    """Result sensors are only created once a result source is set up."""
+
+    freezer.move_to(QUIET_HOUR)
+    entry: MockConfigEntry = MockConfigEntry(
+        domain=DOMAIN, options=stand_in_options(stand_in_server)
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert result_entity_id(hass, LottoTypes.LOTTO) is None
+
+    hass.config_entries.async_update_entry(
+        entry, options=stand_in_options(stand_in_server, results=True)
+    )
+    await hass.async_block_till_done()
+
+    for lotto_type in GAMES:
+        entity_id: str | None = result_entity_id(hass, lotto_type)
+
+        assert entity_id is not None
+        assert hass.states.get(entity_id).state == (
+            entry.runtime_data.component_api.results[lotto_type].draw_date.isoformat()
+        )
+
+    removed_entity_id: str | None = result_entity_id(hass, LottoTypes.LOTTO)
+    hass.config_entries.async_update_entry(
+        entry, options=stand_in_options(stand_in_server)
+    )
+    await hass.async_block_till_done()
+
+    assert result_entity_id(hass, LottoTypes.LOTTO) is None
+    assert hass.states.get(removed_entity_id) is None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+# ------------------------------------------------------------------
+async def test_result_only_fetched_after_a_draw(
+    component_api: ComponentApi,
+    freezer: FrozenDateTimeFactory,
+    stand_in_server: TestServer,
+) -> None:
+    """A stored result is not fetched again until the next draw."""
+
+    freezer.move_to(QUIET_HOUR)
+    component_api.update_options(stand_in_options(stand_in_server, results=True))
+
+    await component_api.async_update()
+    assert component_api.results[LottoTypes.LOTTO].numbers == (3, 8, 14, 19, 22, 27, 33)
+
+    for lotto_type in GAMES:
+        component_api.scrape_scheduler.postpone(lotto_type, QUIET_HOUR)
+
+    await component_api.async_update()
+    assert component_api.metrics.game("lotto_result").requests == 1
@@ -0,0 +1,46 @@
+"""Tests of the row generator."""
+
+import pytest
+
+from custom_components.lotto_dk.games import GAMES, LottoTypes
+from custom_components.lotto_dk.row_generator import ROWS_MAX, random_rows, system_rows
+from custom_components.lotto_dk.tickets import parse_row
+
+EURO_JACKPOT = GAMES[LottoTypes.EURO_JACKPOT].rules
+
+
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("count", [1, 1000])
+@pytest.mark.parametrize("lotto_type", list(GAMES))
+def test_random_rows(lotto_type: LottoTypes, count: int) -> None:
+    """Random rows are unique and follow the rules of the game."""
+
+    rules = GAMES[lotto_type].rules
+    rows: list[str] = list(random_rows(rules, count))
+
+    assert len(set(rows)) == count
+
+    for row in rows:
+        parse_row(row, rules)
+
+
+# ------------------------------------------------------------------
+def test_system_rows() -> None:
+    """A system has a row for every combination of the chosen numbers."""
+
+    rows: list[str] = list(
+        system_rows(EURO_JACKPOT, [1, 2, 3, 4, 5, 6], [1, 2, 3], None)
+    )
+
+    assert len(rows) == 6 * 3
+    assert rows[0] == "1 2 3 4 5 + 1 2"
+
+
+# ------------------------------------------------------------------
+def test_system_rows_capped() -> None:
+    """A system without a count may not have more than ROWS_MAX rows."""
+
+    with pytest.raises(ValueError, match=str(ROWS_MAX)):
+        system_rows(EURO_JACKPOT, list(range(1, 46)), [1, 2], None)
+
+    assert len(list(system_rows(EURO_JACKPOT, list(range(1, 46)), [1, 2], 10))) == 10
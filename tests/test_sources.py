@@ -0,0 +1,120 @@
+"""Tests of the price pool sources against the stand-in server."""
+
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.lotto_dk.component_api import ComponentApi
+from custom_components.lotto_dk.const import (
+    CONF_SOURCE_URL,
+    SOURCE_EMBEDDED_JSON,
+    SOURCE_JSON,
+    SOURCE_TITLE,
+)
+from custom_components.lotto_dk.games import GAMES, LottoTypes
+from custom_components.lotto_dk.metrics import GameMetrics
+from custom_components.lotto_dk.sources import PricePoolSource, TitleSource
+
+from .conftest import PAGE_SIZE, POOLS, stand_in_options
+
+SOURCE_PATHS: dict[str, str] = {
+    SOURCE_TITLE: "",
+    SOURCE_EMBEDDED_JSON: "props.pageProps.jackpot",
+    SOURCE_JSON: "data.jackpot",
+}
+
+
+# ------------------------------------------------------------------
+def test_source_base_is_abstract() -> None:
+    """A source without async_read can not be created."""
+
+    with pytest.raises(TypeError):
+        PricePoolSource(None, {})  # type: ignore[abstract]
+
+
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("source", list(SOURCE_PATHS))
+@pytest.mark.parametrize("lotto_type", list(GAMES))
+async def test_selected_source(
+    component_api: ComponentApi,
+    stand_in_server: TestServer,
+    source: str,
+    lotto_type: LottoTypes,
+) -> None:
+    """Every selectable source reads the price pool of every game."""
+
+    component_api.update_options(
+        stand_in_options(stand_in_server, source, SOURCE_PATHS[source])
+    )
+    metrics: GameMetrics = GameMetrics()
+
+    assert component_api.sources[-1].name == SOURCE_TITLE
+    pool: int | None = await component_api._async_fetch_price_pool(lotto_type, metrics)
+
+    assert pool == POOLS[GAMES[lotto_type].unique_id]
+    assert metrics.last_source == source
+
+
+# ------------------------------------------------------------------
+async def test_title_source_stops_after_title(component_api: ComponentApi) -> None:
+    """The streamed title read does not download the whole page."""
+
+    metrics: GameMetrics = GameMetrics()
+
+    assert await component_api._async_fetch_price_pool(LottoTypes.LOTTO, metrics)
+    assert metrics.bytes_received < PAGE_SIZE // 10
+
+
+# ------------------------------------------------------------------
+async def test_title_source_full_parse(component_api: ComponentApi) -> None:
+    """The full-tree parser reads the same price pool as the streamed read."""
+
+    component_api.sources = [TitleSource(component_api.hass, component_api.urls, False)]
+    metrics: GameMetrics = GameMetrics()
+
+    pool: int | None = await component_api._async_fetch_price_pool(
+        LottoTypes.LOTTO, metrics
+    )
+
+    assert pool == POOLS["lotto"]
+    assert metrics.bytes_received >= PAGE_SIZE // 2
+
+
+# ------------------------------------------------------------------
+async def test_structured_source_falls_back_to_title(
+    component_api: ComponentApi, stand_in_server: TestServer
+) -> None:
+    """A structured source which fails falls back to the page title."""
+
+    component_api.update_options(
+        stand_in_options(stand_in_server, SOURCE_EMBEDDED_JSON, "props.missing")
+    )
+    metrics: GameMetrics = GameMetrics()
+
+    pool: int | None = await component_api._async_fetch_price_pool(
+        LottoTypes.LOTTO, metrics
+    )
+
+    assert pool == POOLS["lotto"]
+    assert metrics.last_source == SOURCE_TITLE
+    assert metrics.errors["KeyError"] == 1
+
+
+# ------------------------------------------------------------------
+async def test_unreachable_source_falls_back_to_title(
+    component_api: ComponentApi, stand_in_server: TestServer, unused_tcp_port: int
+) -> None:
+    """A structured source which can not be reached falls back to the page title."""
+
+    component_api.update_options(
+        {
+            **stand_in_options(stand_in_server, SOURCE_JSON, "data.jackpot"),
+            CONF_SOURCE_URL: f"http://127.0.0.1:{unused_tcp_port}/api/{{game}}",
+        }
+    )
+
+    assert await component_api._async_get_price_pool(LottoTypes.LOTTO) == POOLS["lotto"]
+
+    metrics: GameMetrics = component_api.metrics.game("lotto")
+
+    assert metrics.last_source == SOURCE_TITLE
+    assert metrics.errors["ClientConnectorError"] == 1
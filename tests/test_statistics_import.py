@@ -0,0 +1,36 @@
+"""Tests of the price pool statistics import."""
+
+from pathlib import Path
+
+import pytest
+
+from custom_components.lotto_dk.statistics_import import async_import_statistics
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+GAMES: dict[str, str] = {"lotto": "Lotto"}
+
+
+# ------------------------------------------------------------------
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        ('{"rows": [{"game": "lotto"}]}', "Could not read"),
+        ('[{"game": "lotto", "time": "2026-10-10T20:00:00"}]', "Invalid row"),
+        (
+            '[{"game": "lotto", "time": "2026-10-10T20:00:00", "price_pool": null}]',
+            "Invalid row",
+        ),
+    ],
+)
+async def test_invalid_json_archive(
+    hass: HomeAssistant, tmp_path: Path, content: str, message: str
+) -> None:
+    """A JSON archive which is not a list of rows raises HomeAssistantError."""
+
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    archive: Path = tmp_path / "archive.json"
+    archive.write_text(content, encoding="utf-8")
+
+    with pytest.raises(HomeAssistantError, match=message):
+        await async_import_statistics(hass, str(archive), GAMES)
@@ -0,0 +1,67 @@
+"""Tests of the ticket check."""
+
+from datetime import date
+
+import pytest
+
+from custom_components.lotto_dk.games import GAMES, GameRules, LottoTypes
+from custom_components.lotto_dk.results import DrawResult
+from custom_components.lotto_dk.tickets import check_rows, drawn_result
+
+LOTTO = GAMES[LottoTypes.LOTTO].rules
+EURO_JACKPOT = GAMES[LottoTypes.EURO_JACKPOT].rules
+DRAW_DATE = date(2026, 10, 10)
+
+
+# ------------------------------------------------------------------
+def test_drawn_result() -> None:
+    """Drawn numbers given by hand become a draw result."""
+
+    assert drawn_result(
+        EURO_JACKPOT, DRAW_DATE, [45, 4, 17, 23, 38], [9, 2]
+    ) == DrawResult(DRAW_DATE, (4, 17, 23, 38, 45), (2, 9))
+
+
+# ------------------------------------------------------------------
+@pytest.mark.parametrize(
+    ("rules", "numbers", "extra_numbers"),
+    [
+        (EURO_JACKPOT, [4, 17, 23, 38], [2, 9]),
+        (EURO_JACKPOT, [4, 17, 23, 38, 38], [2, 9]),
+        (EURO_JACKPOT, [4, 17, 23, 38, 51], [2, 9]),
+        (EURO_JACKPOT, [4, 17, 23, 38, 45], [2, 13]),
+        (LOTTO, [3, 8, 14, 19, 22, 27, 33], [33]),
+        (LOTTO, [3, 8, 14, 19, 22, 27, 33], []),
+    ],
+)
+def test_drawn_result_invalid(
+    rules: GameRules, numbers: list[int], extra_numbers: list[int]
+) -> None:
+    """Drawn numbers against the rules of the game are rejected."""
+
+    with pytest.raises(ValueError):
+        drawn_result(rules, DRAW_DATE, numbers, extra_numbers)
+
+
+# ------------------------------------------------------------------
+def test_check_rows_lotto() -> None:
+    """The Lotto tillaegstal is matched against the numbers of the row."""
+
+    result: DrawResult = drawn_result(
+        LOTTO, DRAW_DATE, [3, 8, 14, 19, 22, 27, 33], [11]
+    )
+    checked: dict = check_rows(
+        [
+            (1, "3 8 14 19 22 27 33"),
+            (2, "3 8 14 19 22 27 11"),
+            (3, "3 8 14 19 1 2 11"),
+            (4, "1 2 4 5 6 7 9"),
+        ],
+        LOTTO,
+        result,
+    )
+
+    assert checked["tiers"]["7"] == 1
+    assert checked["tiers"]["6+1"] == 1
+    assert checked["tiers"]["4+1"] == 1
+    assert [row["row"] for row in checked["winning_rows"]] == [1, 2, 3]